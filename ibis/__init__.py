@@ -4,10 +4,11 @@ from __future__ import annotations
 
 __version__ = "10.0.0"
 
+import importlib
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ibis import examples, util
+from ibis import util
 from ibis.backends import BaseBackend
 from ibis.common.exceptions import IbisError
 from ibis.config import options
@@ -16,6 +17,10 @@ from ibis.expr import types as ir
 from ibis.expr.api import *  # noqa: F403
 from ibis.expr.operations import udf
 
+if TYPE_CHECKING:
+    from ibis import examples
+    from ibis.expr.sql import parse_sql, to_sql
+
 __all__ = [  # noqa: PLE0604
     "api",
     "examples",
@@ -25,6 +30,8 @@ __all__ = [  # noqa: PLE0604
     "BaseBackend",
     "IbisError",
     "options",
+    "parse_sql",
+    "to_sql",
     *api.__all__,
 ]
 
@@ -138,5 +145,9 @@ def __getattr__(name: str) -> Any:
         )
 
         return null()  # noqa: F405
+    elif name == "examples":
+        return importlib.import_module("ibis.examples")
+    elif name in ("parse_sql", "to_sql"):
+        return globals().setdefault(name, getattr(api, name))
     else:
         return load_backend(name)
@@ -22,7 +22,14 @@ import ibis.expr.types as ir
 from ibis import util
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+    from collections.abc import (
+        Callable,
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+        Sequence,
+    )
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -89,6 +96,36 @@ class TablesAccessor(collections.abc.Mapping):
         return self._backend.list_tables()
 
 
+_CSV_ENCODE_WORKERS = 4
+"""Number of record batches `to_csv` encodes concurrently."""
+
+
+def _pipelined(
+    func: Callable[[Any], Any], items: Iterable[Any], *, max_workers: int
+) -> Iterator[Any]:
+    """Apply `func` to `items` on worker threads, yielding results in order.
+
+    Items are pulled on the calling thread, because many database cursors are
+    bound to the thread that created them. Up to `2 * max_workers` items and
+    their results are held in memory at once, so callers should keep
+    `max_workers` small when items are large.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 class _FileIOHandler:
     @staticmethod
     def _import_pyarrow():
@@ -473,8 +510,10 @@ class _FileIOHandler:
 
         with expr.to_pyarrow_batches(params=params) as batch_reader:
             with pq.ParquetWriter(path, batch_reader.schema, **kwargs) as writer:
-                for batch in batch_reader:
-                    writer.write_batch(batch)
+                # encode and write on a background thread while the next
+                # batches are fetched
+                for _ in _pipelined(writer.write_batch, batch_reader, max_workers=1):
+                    pass
 
     @util.experimental
     def to_parquet_dir(
@@ -484,6 +523,7 @@ class _FileIOHandler:
         directory: str | Path,
         *,
         params: Mapping[ir.Scalar, Any] | None = None,
+        partition_by: str | Sequence[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """Write the results of executing the given expression to a parquet file in a directory.
@@ -491,6 +531,10 @@ class _FileIOHandler:
         This method is eager and will execute the associated expression
         immediately.
 
+        Files are encoded and written by multiple threads. Use the
+        `max_rows_per_file` and `max_rows_per_group` keyword arguments to roll
+        the output over into multiple files and to size their row groups.
+
         Parameters
         ----------
         expr
@@ -499,6 +543,9 @@ class _FileIOHandler:
             The data source. A string or Path to the directory where the parquet file will be written.
         params
             Mapping of scalar parameter expressions to value.
+        partition_by
+            Column name or names to partition the output by, written as
+            hive-style `column=value` subdirectories.
         **kwargs
             Additional keyword arguments passed to pyarrow.dataset.write_dataset
 
@@ -508,6 +555,10 @@ class _FileIOHandler:
         self._import_pyarrow()
         import pyarrow.dataset as ds
 
+        if partition_by is not None:
+            kwargs.setdefault("partitioning", util.promote_list(partition_by))
+            kwargs.setdefault("partitioning_flavor", "hive")
+
         # by default write_dataset creates the directory
         with expr.to_pyarrow_batches(params=params) as batch_reader:
             ds.write_dataset(
@@ -538,17 +589,30 @@ class _FileIOHandler:
         params
             Mapping of scalar parameter expressions to value.
         kwargs
-            Additional keyword arguments passed to pyarrow.csv.CSVWriter
+            Additional keyword arguments passed to pyarrow.csv.write_csv
 
-        https://arrow.apache.org/docs/python/generated/pyarrow.csv.CSVWriter.html
+        https://arrow.apache.org/docs/python/generated/pyarrow.csv.write_csv.html
         """
-        self._import_pyarrow()
+        pa = self._import_pyarrow()
         import pyarrow.csv as pcsv
 
+        def encode(batch: pa.RecordBatch) -> pa.Buffer:
+            sink = pa.BufferOutputStream()
+            pcsv.write_csv(batch, sink, **kwargs)
+            return sink.getvalue()
+
         with expr.to_pyarrow_batches(params=params) as batch_reader:
-            with pcsv.CSVWriter(path, batch_reader.schema, **kwargs) as writer:
-                for batch in batch_reader:
-                    writer.write_batch(batch)
+            # every encoded batch starts with the header (if any), which is
+            # written once and sliced off the rest
+            header = encode(batch_reader.schema.empty_table())
+            skip = len(header)
+            with pa.output_stream(path, compression=None) as out:
+                out.write(header)
+                # batches are encoded in parallel and written in order
+                for buf in _pipelined(
+                    encode, batch_reader, max_workers=_CSV_ENCODE_WORKERS
+                ):
+                    out.write(buf[skip:])
 
     @util.experimental
     def to_delta(
@@ -1103,7 +1167,7 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
             raise NotImplementedError(self.name)
 
     def _verify_in_memory_tables_are_unique(self, expr: ir.Expr) -> None:
-        memtables = expr.op().find(ops.InMemoryTable)
+        memtables = expr.op().__facts__.memtables
         name_counts = Counter(op.name for op in memtables)
 
         if duplicate_names := sorted(
@@ -26,7 +26,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, UrlFromPath
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import AlterTable, RenameTable
 
 if TYPE_CHECKING:
@@ -69,6 +69,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             raise
         return cur
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -239,6 +240,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             namespace=ops.Namespace(catalog=catalog, database=database),
         ).to_expr()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -338,6 +340,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             "athena does not provide a way to programmatically access its version"
         )
 
+    @invalidates_metadata
     def do_connect(
         self,
         *,
@@ -453,6 +456,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         self._fs.rm(path, recursive=True)
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -461,6 +465,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sql, unload=False):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -469,6 +474,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sql, unload=False):
             pass
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -629,6 +635,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             }
         )
 
+    @invalidates_metadata
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
 
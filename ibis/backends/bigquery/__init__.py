@@ -33,7 +33,7 @@ from ibis.backends.bigquery.client import (
     schema_from_bigquery_table,
 )
 from ibis.backends.bigquery.datatypes import BigQuerySchema
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
@@ -242,6 +242,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         return self.table(table_name, database=(catalog, database))
 
+    @invalidates_metadata
     def read_parquet(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ):
@@ -269,6 +270,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             ),
         )
 
+    @invalidates_metadata
     def read_csv(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -297,6 +299,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         )
         return self._read_file(path, table_name=table_name, job_config=job_config)
 
+    @invalidates_metadata
     def read_json(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -332,6 +335,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             **kwargs,
         )
 
+    @invalidates_metadata
     def do_connect(
         self,
         project_id: str | None = None,
@@ -530,6 +534,7 @@ class Backend(SQLBackend, CanCreateDatabase):
     def dataset_id(self):
         return self.dataset
 
+    @invalidates_metadata
     def create_database(
         self,
         name: str,
@@ -559,6 +564,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         self.raw_sql(stmt.sql(self.name))
 
+    @invalidates_metadata
     def drop_database(
         self,
         name: str,
@@ -879,6 +885,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             return ".".join(f"`{part}`" for part in func.split("."))
         return func
 
+    @cached_metadata
     def get_schema(
         self,
         name,
@@ -913,6 +920,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         ]
         return self._filter_with_like(results, like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -957,6 +965,7 @@ class Backend(SQLBackend, CanCreateDatabase):
     def version(self):
         return bq.__version__
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -1102,6 +1111,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         self.raw_sql(sql)
         return self.table(table.name, database=(table.catalog, table.db))
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -1123,6 +1133,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         )
         self.raw_sql(stmt.sql(self.name))
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -1149,6 +1160,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         self.raw_sql(stmt.sql(self.name))
         return self.table(name, database=(catalog, database))
 
+    @invalidates_metadata
     def drop_view(
         self, name: str, /, *, database: str | None = None, force: bool = False
     ) -> None:
@@ -28,7 +28,7 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend, CanCreateDatabase
 from ibis.backends.clickhouse.converter import ClickHousePandasData
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import C
 
 if TYPE_CHECKING:
@@ -105,6 +105,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         with contextlib.suppress(KeyError):
             kwargs["secure"] = bool(ast.literal_eval(kwargs["secure"]))
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str = "localhost",
@@ -212,6 +213,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             databases = []
         return self._filter_with_like(databases, like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
     ) -> list[str]:
@@ -505,6 +507,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         """Close ClickHouse connection."""
         self.con.close()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -556,6 +559,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             with closing(self.raw_sql(f"DROP VIEW {name}")):
                 pass
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, force: bool = False, engine: str = "Atomic"
     ) -> None:
@@ -570,16 +574,19 @@ class Backend(SQLBackend, CanCreateDatabase):
         with self._safe_raw_sql(src):
             pass
 
+    @invalidates_metadata
     def drop_database(self, name: str, /, *, force: bool = False) -> None:
         src = sge.Drop(this=sg.to_identifier(name), kind="DATABASE", exists=force)
         with self._safe_raw_sql(src):
             pass
 
+    @invalidates_metadata
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         ident = sg.table(name, db=database).sql(self.name)
         with self._safe_raw_sql(f"TRUNCATE TABLE {ident}"):
             pass
 
+    @invalidates_metadata
     def read_parquet(
         self,
         path: str | Path,
@@ -610,6 +617,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             )
         return table
 
+    @invalidates_metadata
     def read_csv(
         self,
         path: str | Path,
@@ -634,6 +642,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             insert_file(client=self.con, table=name, file_path=file_path, **kwargs)
         return table
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -787,6 +796,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         return self.table(name, database=database)
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -25,7 +25,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, UrlFromPath
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, AlterTable, RenameTable
 
 if TYPE_CHECKING:
@@ -64,6 +64,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             raise
         return cur
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -230,6 +231,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             namespace=ops.Namespace(catalog=catalog, database=database),
         ).to_expr()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -302,6 +304,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             [(version_info,)] = cur.fetchall()
         return version_info["dbsql_version"]
 
+    @invalidates_metadata
     def do_connect(
         self,
         *,
@@ -426,6 +429,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             cur.execute(sql)
             cur.execute(f"REMOVE '{path}'")
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -433,6 +437,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sge.Create(this=name, kind="SCHEMA", replace=force)):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -440,6 +445,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sge.Drop(this=name, kind="SCHEMA", replace=force)):
             pass
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -591,6 +597,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             }
         )
 
+    @invalidates_metadata
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import queue
+import threading
 import typing
 from collections.abc import Mapping
 from pathlib import Path
@@ -22,7 +24,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateCatalog, CanCreateDatabase, NoUrl
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import C
 from ibis.common.dispatch import lazy_singledispatch
 from ibis.expr.operations.udf import InputType
@@ -45,6 +47,8 @@ except ImportError:
     RuntimeConfig = None
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
     import pandas as pd
     import polars as pl
 
@@ -68,17 +72,123 @@ def as_nullable(dtype: dt.DataType) -> dt.DataType:
         return dtype.copy(nullable=True)
 
 
+def _batch_conformer(schema: pa.Schema) -> Callable[[pa.RecordBatch], pa.RecordBatch]:
+    """Return a function converting record batches to `schema`.
+
+    DataFusion lowercases column names and may produce different types than
+    the expression's, see
+    https://github.com/apache/arrow-datafusion-python/issues/534. How to fix
+    up a batch is decided once per distinct batch schema, so that batches
+    already matching `schema` pass through untouched and batches only
+    differing by name aren't copied.
+    """
+    types = schema.types
+
+    def rename(batch):
+        return pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+
+    def cast(batch):
+        return pa.RecordBatch.from_arrays(
+            [column.cast(typ, safe=False) for column, typ in zip(batch.columns, types)],
+            schema=schema,
+        )
+
+    converters = {}
+
+    def conform(batch):
+        batch_schema = batch.schema
+        try:
+            convert = converters[batch_schema]
+        except KeyError:
+            if batch_schema == schema:
+                convert = None
+            elif batch_schema.types == types:
+                convert = rename
+            else:
+                convert = cast
+            converters[batch_schema] = convert
+        return batch if convert is None else convert(batch)
+
+    return conform
+
+
+def _drain_partitions(
+    streams: Sequence[df.RecordBatchStream],
+    convert: Callable[[pa.RecordBatch], pa.RecordBatch],
+    *,
+    max_workers: int,
+) -> Iterator[pa.RecordBatch]:
+    """Yield the converted batches of `streams`, consuming them concurrently.
+
+    Batches are yielded in the order they are produced. DataFusion releases
+    the GIL while computing a batch, so partitions are executed and converted
+    in parallel instead of being merged into a single stream first.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    done = object()
+    results = queue.Queue(maxsize=2 * max_workers)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            with contextlib.suppress(queue.Full):
+                results.put(item, timeout=0.1)
+                return
+
+    def drain(stream):
+        try:
+            for batch in stream:
+                if stop.is_set():
+                    return
+                put(convert(batch.to_pyarrow()))
+        except Exception as e:  # noqa: BLE001
+            put(e)
+        finally:
+            put(done)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(drain, stream) for stream in streams]
+        try:
+            for _ in streams:
+                while (item := results.get()) is not done:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+        finally:
+            stop.set()
+            # partitions that haven't started yet are never executed
+            for future in futures:
+                future.cancel()
+
+
 class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
     name = "datafusion"
     supports_arrays = True
     compiler = sc.datafusion.compiler
 
+    class Options(ibis.config.Config):
+        """DataFusion options.
+
+        Attributes
+        ----------
+        stream_workers : int
+            Number of threads consuming the partitions of a query result
+            concurrently. With `1` the partitions are merged by DataFusion and
+            consumed as a single stream, which preserves the result's order
+            across partitions.
+
+        """
+
+        stream_workers: ibis.config.PosInt = 1
+
     @property
     def version(self):
         import importlib.metadata
 
         return importlib.metadata.version("datafusion")
 
+    @invalidates_metadata
     def do_connect(
         self, config: Mapping[str, str | Path] | SessionContext | None = None
     ) -> None:
@@ -247,12 +357,12 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
             self.con.register_udf(udf)
 
     def _register_udfs(self, expr: ir.Expr) -> None:
-        for udf_node in expr.op().find(ops.ScalarUDF):
+        for udf_node in expr.op().__facts__.udfs:
             if udf_node.__input_type__ == InputType.PYARROW:
                 udf = self._compile_pyarrow_udf(udf_node)
                 self.con.register_udf(udf)
 
-        for udf_node in expr.op().find(ops.ElementWiseVectorizedUDF):
+        for udf_node in expr.op().__facts__.find(ops.ElementWiseVectorizedUDF):
             udf = self._compile_elementwise_udf(udf_node)
             self.con.register_udf(udf)
 
@@ -301,12 +411,14 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         result = self.con.sql(code).to_pydict()
         return self._filter_with_like(result["table_catalog"], like)
 
+    @invalidates_metadata
     def create_catalog(self, name: str, /, *, force: bool = False) -> None:
         with self._safe_raw_sql(
             sge.Create(kind="DATABASE", this=sg.to_identifier(name), exists=force)
         ):
             pass
 
+    @invalidates_metadata
     def drop_catalog(self, name: str, /, *, force: bool = False) -> None:
         raise com.UnsupportedOperationError(
             "DataFusion does not support dropping databases"
@@ -320,6 +432,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
             like=like,
         )
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -328,6 +441,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         with self._safe_raw_sql(sge.Create(kind="SCHEMA", this=db_name, exists=force)):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -335,6 +449,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         with self._safe_raw_sql(sge.Drop(kind="SCHEMA", this=db_name, exists=force)):
             pass
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
     ) -> list[str]:
@@ -363,6 +478,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
             self.raw_sql(query).to_pydict()["table_name"], like
         )
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -392,6 +508,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         # of registering the table
         self.con.from_arrow(op.data.to_pyarrow(op.schema), op.name)
 
+    @invalidates_metadata
     def read_csv(
         self,
         paths: str | Path | list[str | Path] | tuple[str | Path],
@@ -424,6 +541,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         self.con.register_csv(table_name, path, **kwargs)
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_parquet(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -451,6 +569,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         self.con.register_parquet(table_name, path, **kwargs)
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_delta(
         self, path: str | Path, /, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -512,25 +631,19 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         schema = sch.Schema(
             {name: as_nullable(typ) for name, typ in table_expr.schema().items()}
         )
-        names = schema.names
-
-        struct_schema = schema.as_struct().to_pyarrow()
-
-        def make_gen():
-            yield from (
-                # convert the renamed + casted columns into a record batch
-                pa.RecordBatch.from_struct_array(
-                    # rename columns to match schema because datafusion lowercases things
-                    pa.RecordBatch.from_arrays(batch.to_pyarrow().columns, names=names)
-                    # cast the struct array to the desired types to work around
-                    # https://github.com/apache/arrow-datafusion-python/issues/534
-                    .to_struct_array()
-                    .cast(struct_schema, safe=False)
-                )
-                for batch in frame.execute_stream()
+        arrow_schema = schema.to_pyarrow()
+        conform = _batch_conformer(arrow_schema)
+
+        options = ibis.options.datafusion
+        workers = 1 if options is None else options.stream_workers
+        if workers > 1:
+            batches = _drain_partitions(
+                frame.execute_stream_partitioned(), conform, max_workers=workers
             )
+        else:
+            batches = (conform(batch.to_pyarrow()) for batch in frame.execute_stream())
 
-        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), make_gen())
+        return pa.ipc.RecordBatchReader.from_batches(arrow_schema, batches)
 
     def to_pyarrow(
         self,
@@ -563,6 +676,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
             batch_reader.read_pandas(timestamp_as_object=True)
         )
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -664,6 +778,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
 
         return self.table(name, database=database)
 
+    @invalidates_metadata
     def truncate_table(self, name: str, /, *, database: str | None = None):
         """Delete all rows from a table.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pyarrow as pa
 import pytest
 from datafusion import (
     SessionContext,
@@ -43,3 +44,51 @@ def test_context_config(name_to_path):
         ctx.register_parquet(name, str(path))
     conn = ibis.datafusion.connect(ctx)
     assert sorted(conn.list_tables()) == sorted(name_to_path)
+
+
+def test_stream_workers(monkeypatch):
+    con = ibis.datafusion.connect()
+    monkeypatch.setattr(ibis.options.datafusion, "stream_workers", 4)
+
+    partitions = [
+        [pa.record_batch({"X": pa.array(range(i, 1000, 8), type=pa.int32())})]
+        for i in range(8)
+    ]
+    con.con.register_record_batches("parts", partitions)
+    t = con.table("parts")
+    expr = t.mutate(Y=t.X.cast("int64") * 2)
+
+    result = con.to_pyarrow(expr)
+    assert result.schema == expr.schema().to_pyarrow()
+    assert sorted(result["X"].to_pylist()) == list(range(1000))
+
+    # abandoning the reader stops consuming the remaining partitions
+    reader = con.to_pyarrow_batches(expr)
+    assert reader.read_next_batch().num_rows
+    reader.close()
+
+
+def test_drain_partitions_cancels_pending_streams():
+    from ibis.backends.datafusion import _drain_partitions
+
+    class Batch:
+        def to_pyarrow(self):
+            return pa.record_batch({"x": [1]})
+
+    started = []
+
+    class Stream:
+        def __init__(self, i):
+            self.i = i
+
+        def __iter__(self):
+            started.append(self.i)
+            yield Batch()
+
+    batches = _drain_partitions(
+        [Stream(i) for i in range(8)], lambda batch: batch, max_workers=1
+    )
+    assert next(batches).num_rows == 1
+    batches.close()
+
+    assert len(started) < 8
@@ -16,7 +16,7 @@ import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
 from ibis import util
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR
 from ibis.backends.sql.datatypes import DruidType
 from ibis.backends.tests.errors import PyDruidProgrammingError
@@ -79,6 +79,7 @@ class Backend(SQLBackend):
         # https://druid.apache.org/docs/latest/querying/sql-metadata-tables.html#schemata-table
         return "druid"
 
+    @invalidates_metadata
     def do_connect(self, **kwargs: Any) -> None:
         """Create an Ibis client using the passed connection parameters.
 
@@ -165,6 +166,7 @@ class Backend(SQLBackend):
             tables = result.fetchall()
         return bool(tables)
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -202,6 +204,7 @@ class Backend(SQLBackend):
         df = PandasData.convert_table(df, schema)
         return df
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -215,9 +218,11 @@ class Backend(SQLBackend):
     ) -> ir.Table:
         raise NotImplementedError()
 
+    @invalidates_metadata
     def drop_table(self, *args, **kwargs):
         raise NotImplementedError()
 
+    @cached_metadata
     def list_tables(
         self, like: str | None = None, database: str | None = None
     ) -> list[str]:
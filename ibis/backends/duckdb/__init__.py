@@ -6,6 +6,7 @@ import ast
 import contextlib
 import urllib
 import warnings
+import weakref
 from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -27,7 +28,7 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, UrlFromPath
 from ibis.backends.duckdb.converter import DuckDBPandasData, DuckDBPyArrowData
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, AlterTable, C, RenameTable
 from ibis.common.dispatch import lazy_singledispatch
 from ibis.expr.operations.udf import InputType
@@ -94,6 +95,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             query = query.sql(dialect=self.name)
         return self.con.execute(query, **kwargs)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -268,6 +270,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             namespace=ops.Namespace(catalog=catalog, database=database),
         ).to_expr()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -363,6 +366,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return importlib.metadata.version("duckdb")
 
+    @invalidates_metadata
     def do_connect(
         self,
         database: str | Path = ":memory:",
@@ -446,6 +450,10 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         self._record_batch_readers_consumed = {}
 
+        # mapping of udf names to the udf classes registered on this
+        # connection, so that udfs are registered once instead of per query
+        self._registered_udfs = weakref.WeakValueDictionary()
+
     def _load_extensions(
         self, extensions: list[str], force_install: bool = False
     ) -> None:
@@ -476,6 +484,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         """
         self._load_extensions([extension], force_install=force_install)
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -488,6 +497,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sge.Create(this=name, kind="SCHEMA", replace=force)):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -500,6 +510,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         with self._safe_raw_sql(sge.Drop(this=name, kind="SCHEMA", replace=force)):
             pass
 
+    @invalidates_metadata
     @util.experimental
     def read_json(
         self,
@@ -568,6 +579,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_csv(
         self,
         paths: str | list[str] | tuple[str],
@@ -701,6 +713,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_geo(
         self, path: str, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -752,6 +765,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             pass
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_parquet(
         self,
         paths: str | Path | Iterable[str | Path],
@@ -826,6 +840,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         # by the time we execute against this so we register it
         # explicitly.
 
+    @invalidates_metadata
     def read_delta(
         self, path: str, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -866,6 +881,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         self.con.register(table_name, delta_table.to_pyarrow_dataset())
         return self.table(table_name)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -940,6 +956,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self._filter_with_like(out[col].to_pylist(), like)
 
+    @invalidates_metadata
     def read_postgres(
         self, uri: str, /, *, table_name: str | None = None, database: str = "public"
     ) -> ir.Table:
@@ -986,6 +1003,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_mysql(
         self,
         uri: str,
@@ -1028,6 +1046,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self.table(table_name, database=(catalog, database))
 
+    @invalidates_metadata
     def read_sqlite(
         self, path: str | Path, /, *, table_name: str | None = None
     ) -> ir.Table:
@@ -1089,6 +1108,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         return self.table(table_name)
 
+    @invalidates_metadata
     def attach(
         self, path: str | Path, name: str | None = None, read_only: bool = False
     ) -> None:
@@ -1115,6 +1135,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
         self.con.execute(code).fetchall()
 
+    @invalidates_metadata
     def detach(self, name: str) -> None:
         """Detach a database from the current DuckDB session.
 
@@ -1217,7 +1238,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
     def _run_pre_execute_hooks(self, expr: ir.Expr) -> None:
         # Warn for any tables depending on RecordBatchReaders that have already
         # started being consumed.
-        for t in expr.op().find(ops.PhysicalTable):
+        for t in expr.op().__facts__.physical_tables:
             started = self._record_batch_readers_consumed.get(t.name)
             if started is True:
                 warnings.warn(
@@ -1231,7 +1252,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
             elif started is False:
                 self._record_batch_readers_consumed[t.name] = True
 
-        if expr.op().find((ops.GeoSpatialUnOp, ops.GeoSpatialBinOp)):
+        if expr.op().__facts__.has_geospatial:
             self.load_extension("spatial")
 
         super()._run_pre_execute_hooks(expr)
@@ -1330,24 +1351,30 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         table = self._to_duckdb_relation(
             expr, params=params, limit=limit, **kwargs
         ).arrow()
+        schema = expr.as_table().schema()
 
+        # primitive columns are converted by arrow whether or not they contain
+        # nulls, which keeps them in numpy arrays instead of Python objects
         df = pd.DataFrame(
             {
                 name: (
                     col.to_pylist()
+                    # nested values are returned as lists and dicts, which
+                    # `to_pylist()` builds faster than unpacking the numpy
+                    # arrays that `to_pandas()` produces for them
                     if (
                         pat.is_nested(col.type)
                         or
                         # pyarrow / duckdb type null literals columns as int32?
                         # but calling `to_pylist()` will render it as None
-                        col.null_count
+                        dtype.is_null()
                     )
                     else col.to_pandas()
                 )
-                for name, col in zip(table.column_names, table.columns)
+                for (name, dtype), col in zip(schema.items(), table.columns)
             }
         )
-        df = DuckDBPandasData.convert_table(df, expr.as_table().schema())
+        df = DuckDBPandasData.convert_table(df, schema)
         return expr.__pandas_result__(df)
 
     @util.experimental
@@ -1663,17 +1690,27 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
 
     def _register_udfs(self, expr: ir.Expr) -> None:
         con = self.con
+        registered = self._registered_udfs
+
+        for udf_node in expr.op().__facts__.udfs:
+            udf_class = type(udf_node)
+            name = udf_class.__name__
+
+            # the connection already has this exact definition
+            if registered.get(name) is udf_class:
+                continue
 
-        for udf_node in expr.op().find(ops.ScalarUDF):
             register_func = getattr(
                 self, f"_register_{udf_node.__input_type__.name.lower()}_udf"
             )
             with contextlib.suppress(duckdb.InvalidInputException):
-                con.remove_function(udf_node.__class__.__name__)
+                con.remove_function(name)
+            registered.pop(name, None)
 
             registration_func = register_func(udf_node)
             if registration_func is not None:
                 registration_func(con)
+                registered[name] = udf_class
 
     def _register_udf(self, udf_node: ops.ScalarUDF):
         type_mapper = self.compiler.type_mapper
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gc
 import os
 import subprocess
 import sys
@@ -465,3 +466,82 @@ def test_create_table_with_nulls(con, kwargs):
 
     with pytest.raises(com.IbisTypeError, match="NULL typed columns"):
         con.create_table(name, **kwargs)
+
+
+def test_compile_cache(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "compile_cache_size", 2)
+    con = ibis.duckdb.connect()
+
+    t = ibis.memtable({"a": [1, 2, 3]})
+    value = ibis.param("int64")
+    expr = t.filter(t.a > value).mutate(b=value * 2)
+
+    assert con.execute(expr, params={value: 1}).b.tolist() == [2, 2]
+    assert con.execute(expr, params={value: -1}).b.tolist() == [-2, -2, -2]
+    assert con.execute(expr, params={value: 2}).b.tolist() == [4]
+
+    info = con.compile_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    for n in range(3):
+        con.compile(t.limit(n))
+
+    info = con.compile_cache_info()
+    assert (info.evictions, info.currsize) == (2, 2)
+
+
+def test_compile_cache_remembers_untemplatable(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "compile_cache_size", 2)
+    con = ibis.duckdb.connect()
+
+    calls = []
+
+    def compile_template(expr, **_):
+        calls.append(expr)
+        raise com.UnsupportedOperationError("parameter must be a literal")
+
+    monkeypatch.setattr(con, "_compile_template", compile_template)
+
+    t = ibis.memtable({"a": [1, 2, 3]})
+    value = ibis.param("int64")
+    expr = t.filter(t.a > value)
+
+    assert len(con.execute(expr, params={value: 1})) == 2
+    assert len(con.execute(expr, params={value: 2})) == 1
+    assert len(calls) == 1
+
+
+def test_metadata_cache(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "metadata_cache_size", 8)
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+
+    assert con.list_tables() == ["t"]
+    assert con.table("t").schema() == ibis.schema({"a": "int64"})
+    assert con.table("t").schema() == ibis.schema({"a": "int64"})
+
+    info = con.metadata_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    # registering and dropping memtables invalidates the cache, reusing a
+    # registered memtable doesn't
+    data = ibis.memtable({"a": [1]})
+    con.insert("t", data)
+    assert con.metadata_cache_info().currsize == 1
+    con.execute(data)
+    assert con.metadata_cache_info().currsize == 1
+    del data
+    gc.collect()
+    assert con.metadata_cache_info().currsize == 0
+
+    # ddl issued through the connection invalidates the cache
+    con.create_table("t", schema=ibis.schema({"b": "string"}), overwrite=True)
+    assert con.table("t").schema() == ibis.schema({"b": "string"})
+    con.create_view("v", con.table("t"))
+    assert "v" in con.list_tables()
+
+    # changes made behind the connection's back require a manual flush
+    con.raw_sql("CREATE TABLE u (x INT)")
+    assert "u" not in con.list_tables()
+    con.clear_metadata_cache()
+    assert "u" in con.list_tables()
@@ -134,6 +134,27 @@ def test_kwargs_are_forwarded(con):
         con.execute(expr)
 
 
+def test_udfs_are_registered_once(mocker):
+    con = ibis.duckdb.connect()
+    spy = mocker.spy(con, "_register_python_udf")
+
+    @udf.scalar.python
+    def add_one(x: int) -> int:
+        return x + 1
+
+    assert con.execute(add_one(ibis.literal(1))) == 2
+    assert con.execute(add_one(ibis.literal(2))) == 3
+    assert spy.call_count == 1
+
+    # redefining a udf with the same name replaces the registered function
+    @udf.scalar.python(name="add_one")
+    def add_two(x: int) -> int:
+        return x + 2
+
+    assert con.execute(add_two(ibis.literal(1))) == 3
+    assert spy.call_count == 2
+
+
 def test_builtin_udf_uses_dialect():
     # in raw sqlglot, if you call regexp_extract, it will assume the
     # 3rd arg is "position" and not "groups". So when we make the UDF,
@@ -19,7 +19,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, C
 
 if TYPE_CHECKING:
@@ -55,6 +55,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             [(version,)] = result.fetchall()
         return version
 
+    @invalidates_metadata
     def do_connect(
         self,
         user: str,
@@ -188,6 +189,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         with self.begin() as cur:
             yield cur.execute(query, *args, **kwargs)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | tuple[str, str] | None = None
     ) -> list[str]:
@@ -219,6 +221,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         return self._filter_with_like([table for (table,) in tables], like=like)
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -320,6 +323,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
     _finalize_memtable = _clean_up_tmp_table
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -424,6 +428,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             [(schema,)] = cur.fetchall()
         return schema
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -439,6 +444,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         with self.begin() as con:
             con.execute(drop_schema.sql(dialect=self.dialect))
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -24,7 +24,7 @@ from ibis.backends.flink.ddl import (
     InsertSelect,
     RenameTable,
 )
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.tests.errors import Py4JJavaError
 from ibis.expr.operations.udf import InputType
 from ibis.util import gen_name
@@ -60,6 +60,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         # TODO: remove when ported to sqlglot
         return self.compiler.dialect
 
+    @invalidates_metadata
     def do_connect(self, table_env: TableEnvironment) -> None:
         """Create a Flink `Backend` for use with Ibis.
 
@@ -118,6 +119,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
     def current_database(self) -> str:
         return self._table_env.get_current_database()
 
+    @invalidates_metadata
     def create_database(
         self,
         name: str,
@@ -147,6 +149,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         )
         self.raw_sql(statement.compile())
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -165,6 +168,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         statement = DropDatabase(name=name, catalog=catalog, must_exist=not force)
         self.raw_sql(statement.compile())
 
+    @cached_metadata
     def list_tables(
         self,
         *,
@@ -281,6 +285,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         )
         return node.to_expr()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -342,7 +347,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         return pyflink.version.__version__
 
     def _register_udfs(self, expr: ir.Expr) -> None:
-        for udf_node in expr.op().find(ops.ScalarUDF):
+        for udf_node in expr.op().__facts__.udfs:
             register_func = getattr(
                 self, f"_register_{udf_node.__input_type__.name.lower()}_udf"
             )
@@ -422,6 +427,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
 
         return expr.__pandas_result__(df)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -568,6 +574,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
 
             return self.table(name, database=database, catalog=catalog)
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -602,6 +609,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         )
         self.raw_sql(statement.compile())
 
+    @invalidates_metadata
     def rename_table(
         self,
         old_name: str,
@@ -628,6 +636,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
         sql = statement.compile()
         self.raw_sql(sql)
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -721,6 +730,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
 
         return self.table(name, database=database, catalog=catalog)
 
+    @invalidates_metadata
     def drop_view(
         self,
         name: str,
@@ -805,6 +815,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
             table_name, schema=schema, tbl_properties=tbl_properties
         )
 
+    @invalidates_metadata
     def read_parquet(
         self,
         path: str | Path,
@@ -835,6 +846,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
             file_type="parquet", path=path, schema=schema, table_name=table_name
         )
 
+    @invalidates_metadata
     def read_csv(
         self,
         path: str | Path,
@@ -865,6 +877,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoUrl):
             file_type="csv", path=path, schema=schema, table_name=table_name
         )
 
+    @invalidates_metadata
     def read_json(
         self,
         path: str | Path,
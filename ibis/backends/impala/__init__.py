@@ -26,7 +26,7 @@ from ibis.backends.impala.udf import (
     wrap_uda,
     wrap_udf,
 )
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -87,6 +87,7 @@ class Backend(SQLBackend):
         self._convert_kwargs(kwargs)
         return self.connect(**kwargs)
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str = "localhost",
@@ -202,6 +203,7 @@ class Backend(SQLBackend):
             databases = fetchall(cur)
         return self._filter_with_like(databases.name.tolist(), like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
     ) -> list[str]:
@@ -285,6 +287,7 @@ class Backend(SQLBackend):
             [(db,)] = cur.fetchall()
         return db
 
+    @invalidates_metadata
     def create_database(self, name, path=None, force=False):
         """Create a new Impala database.
 
@@ -301,6 +304,7 @@ class Backend(SQLBackend):
         statement = ddl.CreateDatabase(name, path=path, can_exist=force)
         self._safe_exec_sql(statement)
 
+    @invalidates_metadata
     def drop_database(self, name, force=False):
         """Drop an Impala database.
 
@@ -348,6 +352,7 @@ class Backend(SQLBackend):
         statement = ddl.DropDatabase(name, must_exist=not force)
         self._safe_exec_sql(statement)
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -423,6 +428,7 @@ class Backend(SQLBackend):
     def set_compression_codec(self, codec):
         self.set_options({"COMPRESSION_CODEC": str(codec).lower()})
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -437,12 +443,14 @@ class Backend(SQLBackend):
         self._safe_exec_sql(statement)
         return self.table(name, database=database)
 
+    @invalidates_metadata
     def drop_view(
         self, name, /, *, database: str | None = None, force: bool = False
     ) -> None:
         stmt = ddl.DropView(name, database=database, must_exist=not force)
         self._safe_exec_sql(stmt)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -816,6 +824,7 @@ class Backend(SQLBackend):
         )
         self._safe_exec_sql(statement.compile())
 
+    @invalidates_metadata
     def drop_table(
         self, name: str, /, *, database: str | None = None, force: bool = False
     ) -> None:
@@ -839,6 +848,7 @@ class Backend(SQLBackend):
         statement = ddl.DropTable(name, database=database, must_exist=not force)
         self._safe_exec_sql(statement)
 
+    @invalidates_metadata
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         """Delete all rows from an existing table.
 
@@ -852,6 +862,7 @@ class Backend(SQLBackend):
         statement = ddl.TruncateTable(name, database=database)
         self._safe_exec_sql(statement)
 
+    @invalidates_metadata
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
 
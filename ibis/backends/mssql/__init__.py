@@ -6,6 +6,7 @@ import contextlib
 import datetime
 import struct
 from contextlib import closing
+from functools import partial
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
@@ -23,11 +24,10 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateCatalog, CanCreateDatabase
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, C
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -79,6 +79,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
     name = "mssql"
     compiler = sc.mssql.compiler
     supports_create_or_replace = False
+    _bind_paramstyle = "qmark"
 
     @property
     def version(self) -> str:
@@ -86,6 +87,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
             [(version,)] = cur.fetchall()
         return version
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str = "localhost",
@@ -244,6 +246,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
 
         return self.connect(**kwargs)
 
+    @cached_metadata
     def get_schema(
         self, name: str, *, catalog: str | None = None, database: str | None = None
     ) -> sch.Schema:
@@ -413,12 +416,12 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
             cur.close()
 
     @contextlib.contextmanager
-    def _safe_raw_sql(self, query, *args, **kwargs):
+    def _safe_raw_sql(self, query, *args, params=(), **kwargs):
         with contextlib.suppress(AttributeError):
             query = query.sql(self.dialect)
 
         with self.begin() as cur:
-            cur.execute(query, *args, **kwargs)
+            cur.execute(query, *args, *params, **kwargs)
             yield cur
 
     @contextlib.contextmanager
@@ -440,6 +443,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
         cursor.execute(query, **kwargs)
         return cursor
 
+    @invalidates_metadata
     def create_catalog(self, name: str, /, *, force: bool = False) -> None:
         expr = (
             sg.select(STAR)
@@ -462,6 +466,7 @@ GO"""
         with self._safe_ddl(create_stmt):
             pass
 
+    @invalidates_metadata
     def drop_catalog(self, name: str, /, *, force: bool = False) -> None:
         with self._safe_ddl(
             sge.Drop(
@@ -472,6 +477,7 @@ GO"""
         ):
             pass
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -516,6 +522,7 @@ GO"""
                     )
                 )
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -547,6 +554,7 @@ GO"""
                     )
                 )
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -611,6 +619,7 @@ GO"""
             results = list(map(itemgetter(0), cur.fetchall()))
         return self._filter_with_like(results, like=like)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -776,27 +785,14 @@ GO"""
             ),
         )
 
-        df = op.data.to_frame()
-        data = df.itertuples(index=False)
-
         insert_stmt = self._build_insert_template(name, schema=schema, columns=True)
         with self._safe_ddl(create_stmt) as cur:
-            if not df.empty:
-                cur.executemany(insert_stmt, data)
+            cur.fast_executemany = self._supports_fast_executemany
+            self._insert_memtable_chunks(op, partial(cur.executemany, insert_stmt))
 
-    def _cursor_batches(
-        self,
-        expr: ir.Expr,
-        params: Mapping[ir.Scalar, Any] | None = None,
-        limit: int | str | None = None,
-        chunk_size: int = 1 << 20,
-    ) -> Iterable[list[tuple]]:
-        def process_value(value, dtype):
-            return bool(value) if dtype.is_boolean() else value
-
-        types = expr.as_table().schema().types
-
-        for batch in super()._cursor_batches(
-            expr, params=params, limit=limit, chunk_size=chunk_size
-        ):
-            yield [tuple(map(process_value, row, types)) for row in batch]
+    @property
+    def _supports_fast_executemany(self) -> bool:
+        # FreeTDS doesn't implement the parameter arrays that
+        # `fast_executemany` binds, Microsoft's drivers do
+        driver = self.con.getinfo(pyodbc.SQL_DRIVER_NAME)
+        return "msodbcsql" in driver.lower()
@@ -319,3 +319,11 @@ def test_non_ascii_column_name(con):
     names = schema.names
     assert len(names) == 1
     assert names[0] == "калона"
+
+
+def test_memtable_upload_in_chunks(con):
+    n = 25_000
+    t = ibis.memtable({"x": range(n), "y": [1.5, float("nan")] * (n // 2)})
+    expr = t.aggregate(total=t.x.sum(), nulls=t.y.isnull().sum())
+    result = con.to_pyarrow(expr).to_pylist()
+    assert result == [{"total": n * (n - 1) // 2, "nulls": n // 2}]
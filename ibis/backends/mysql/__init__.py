@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import warnings
-from functools import cached_property
+from functools import cached_property, partial
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
@@ -23,11 +23,11 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, TRUE, C, RenameTable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -39,6 +39,7 @@ class Backend(SQLBackend, CanCreateDatabase):
     name = "mysql"
     compiler = sc.mysql.compiler
     supports_create_or_replace = False
+    _bind_paramstyle = "format"
 
     def _from_url(self, url: ParseResult, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -89,6 +90,7 @@ class Backend(SQLBackend, CanCreateDatabase):
     def version(self):
         return ".".join(map(str, self.con._server_version))
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str = "localhost",
@@ -219,6 +221,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             items[name] = item
         return sch.Schema(items)
 
+    @cached_metadata
     def get_schema(
         self, name: str, *, catalog: str | None = None, database: str | None = None
     ) -> sch.Schema:
@@ -243,6 +246,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         return sch.Schema(fields)
 
+    @invalidates_metadata
     def create_database(self, name: str, force: bool = False) -> None:
         sql = sge.Create(
             kind="DATABASE", exists=force, this=sg.to_identifier(name)
@@ -250,6 +254,7 @@ class Backend(SQLBackend, CanCreateDatabase):
         with self.begin() as cur:
             cur.execute(sql)
 
+    @invalidates_metadata
     def drop_database(self, name: str, force: bool = False) -> None:
         sql = sge.Drop(kind="DATABASE", exists=force, this=sg.to_identifier(name)).sql(
             self.name
@@ -285,6 +290,9 @@ class Backend(SQLBackend, CanCreateDatabase):
         with self.raw_sql(*args, **kwargs) as result:
             yield result
 
+    def _bind_params(self, values: list[Any]) -> dict[str, Any]:
+        return {"args": values}
+
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name)
@@ -310,6 +318,7 @@ class Backend(SQLBackend, CanCreateDatabase):
             return cursor
 
     # TODO: disable positional arguments
+    @cached_metadata
     def list_tables(
         self,
         like: str | None = None,
@@ -393,14 +402,15 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, limit=limit, params=params, **kwargs)
+        sql, bound = self._compile_bound(table, limit=limit, params=params, **kwargs)
 
         schema = table.schema()
 
-        with self._safe_raw_sql(sql) as cur:
+        with self._safe_raw_sql(sql, **bound) as cur:
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -503,19 +513,45 @@ class Backend(SQLBackend, CanCreateDatabase):
         )
         create_stmt_sql = create_stmt.sql(dialect)
 
-        df = op.data.to_frame()
-        # nan can not be used with MySQL
-        df = df.replace(float("nan"), None)
-
-        data = df.itertuples(index=False)
         sql = self._build_insert_template(
             name, schema=schema, columns=True, placeholder="%s"
         )
+        # temporary tables are only visible to the connection that created
+        # them, so the chunks can't be loaded concurrently
         with self.begin() as cur:
             cur.execute(create_stmt_sql)
+            self._insert_memtable_chunks(op, partial(cur.executemany, sql))
+
+    def _cursor_batches(
+        self,
+        expr: ir.Expr,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1 << 20,
+    ) -> Iterable[list]:
+        self._run_pre_execute_hooks(expr)
+
+        sql, bound = self._compile_bound(expr, limit=limit, params=params)
+
+        con = self.con
+        autocommit = con.get_autocommit()
 
-            if not df.empty:
-                cur.executemany(sql, data)
+        # the default cursor buffers the entire result set on the client, an
+        # unbuffered one leaves the rows on the server until they're fetched
+        with contextlib.closing(con.cursor(MySQLdb.cursors.SSCursor)) as cursor:
+            if not autocommit:
+                con.begin()
+            try:
+                cursor.execute(sql, **bound)
+                while batch := cursor.fetchmany(chunk_size):
+                    yield batch
+            except Exception:
+                if not autocommit:
+                    con.rollback()
+                raise
+            else:
+                if not autocommit:
+                    con.commit()
 
     @util.experimental
     def to_pyarrow_batches(
@@ -528,19 +564,43 @@ class Backend(SQLBackend, CanCreateDatabase):
         chunk_size: int = 1_000_000,
         **_: Any,
     ) -> pa.ipc.RecordBatchReader:
-        import pyarrow as pa
+        """Execute expression and return an iterator of PyArrow record batches.
 
-        self._run_pre_execute_hooks(expr)
+        Results are streamed from the server with an unbuffered cursor. The
+        connection cannot run other queries until the returned reader is
+        exhausted or closed.
 
-        schema = expr.as_table().schema()
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
-            df = self._fetch_from_cursor(cursor, schema)
-        table = pa.Table.from_pandas(
-            df, schema=schema.to_pyarrow(), preserve_index=False
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        params
+            Mapping of scalar parameter expressions to value.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
+        pa = self._import_pyarrow()
+
+        from ibis.backends.mysql.converter import MySQLPyArrowRowDecoder
+
+        decoder = MySQLPyArrowRowDecoder(expr.as_table().schema())
+        # convert the rows as they are fetched so that at most `chunk_size`
+        # rows are held in memory at a time
+        batches = map(
+            decoder.decode,
+            self._cursor_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size
+            ),
         )
-        return table.to_reader(max_chunksize=chunk_size)
+        return pa.ipc.RecordBatchReader.from_batches(decoder.arrow_schema, batches)
 
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 
 from ibis.formats.pandas import PandasData
+from ibis.formats.pyarrow import PyArrowRowDecoder
 
 
 class MySQLPandasData(PandasData):
@@ -25,3 +26,14 @@ class MySQLPandasData(PandasData):
         if s.dtype == "object":
             s = s.replace("0000-00-00 00:00:00", None)
         return super().convert_Timestamp(s, dtype, pandas_type)
+
+
+class MySQLPyArrowRowDecoder(PyArrowRowDecoder):
+    """Decode MySQL rows, parsing zero dates, TIME durations and SETs."""
+
+    __slots__ = ()
+
+    def _builder(self, dtype):
+        if dtype.is_temporal() or dtype.is_array():
+            return self._pandas_builder(MySQLPandasData, dtype)
+        return super()._builder(dtype)
@@ -5,6 +5,7 @@ from operator import methodcaller
 
 import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
 import pytest
 import sqlglot as sg
 from pytest import param
@@ -267,3 +268,8 @@ def test_drop_database_exists(con):
         con.drop_database(dbname)
 
     con.drop_database(dbname, force=True)
+
+
+def test_memtable_upload_nan_as_null(con):
+    t = ibis.memtable(pa.table({"x": [1.5, float("nan"), None]}))
+    assert con.execute(t.x.isnull().sum()) == 2
@@ -5,7 +5,7 @@ from __future__ import annotations
 import contextlib
 import re
 import warnings
-from functools import cached_property
+from functools import cached_property, partial
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
@@ -23,7 +23,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanListDatabase
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR, C
 
 if TYPE_CHECKING:
@@ -84,6 +84,7 @@ class Backend(SQLBackend, CanListDatabase):
         matched = re.search(r"(\d+)\.(\d+)\.(\d+)", self.con.version)
         return ".".join(matched.groups())
 
+    @invalidates_metadata
     def do_connect(
         self,
         *,
@@ -267,6 +268,7 @@ class Backend(SQLBackend, CanListDatabase):
             con.commit()
             return cursor
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -339,6 +341,7 @@ class Backend(SQLBackend, CanListDatabase):
 
         return self._filter_with_like(schemata, like)
 
+    @cached_metadata
     def get_schema(
         self, name: str, *, catalog: str | None = None, database: str | None = None
     ) -> sch.Schema:
@@ -379,6 +382,7 @@ class Backend(SQLBackend, CanListDatabase):
 
         return sch.Schema(fields)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -478,6 +482,7 @@ class Backend(SQLBackend, CanListDatabase):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -522,16 +527,14 @@ class Backend(SQLBackend, CanListDatabase):
             properties=sge.Properties(expressions=[sge.TemporaryProperty()]),
         ).sql(self.name)
 
-        data = op.data.to_frame().replace(float("nan"), None)
         insert_stmt = self._build_insert_template(
             name, schema=schema, placeholder=":{i:d}"
         )
+        # the rows of a temporary table are private to the session that
+        # inserted them, so the chunks can't be loaded concurrently
         with self.begin() as cur:
             cur.execute(create_stmt)
-            for start, end in util.chunks(len(data), chunk_size=128):
-                cur.executemany(
-                    insert_stmt, list(data.iloc[start:end].itertuples(index=False))
-                )
+            self._insert_memtable_chunks(op, partial(cur.executemany, insert_stmt))
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name("oracle_metadata")
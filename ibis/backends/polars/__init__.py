@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import tempfile
 from collections.abc import Iterable, Mapping
 from functools import lru_cache
 from pathlib import Path
@@ -22,7 +23,7 @@ from ibis.formats.polars import PolarsSchema
 from ibis.util import gen_name, normalize_filename, normalize_filenames
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     import pandas as pd
     import pyarrow as pa
@@ -436,22 +437,32 @@ class Backend(BaseBackend, NoUrl):
         lazy_frame = self._context.execute(query, eager=False)
         return sch.infer(lazy_frame)
 
-    def _to_dataframe(
+    def _to_lazyframe(
         self,
         expr: ir.Expr,
         params: Mapping[ir.Expr, object] | None = None,
         limit: int | None = None,
-        streaming: bool = False,
-        engine: Literal["cpu", "gpu"] | pl.GPUEngine = "cpu",
         **kwargs: Any,
-    ) -> pl.DataFrame:
+    ) -> pl.LazyFrame:
         self._run_pre_execute_hooks(expr)
-        table_expr = expr.as_table()
-        lf = self.compile(table_expr, params=params, **kwargs)
+        lf = self.compile(expr.as_table(), params=params, **kwargs)
         if limit == "default":
             limit = ibis.options.sql.default_limit
         if limit is not None:
             lf = lf.limit(limit)
+        return lf
+
+    def _to_dataframe(
+        self,
+        expr: ir.Expr,
+        params: Mapping[ir.Expr, object] | None = None,
+        limit: int | None = None,
+        streaming: bool = False,
+        engine: Literal["cpu", "gpu"] | pl.GPUEngine = "cpu",
+        **kwargs: Any,
+    ) -> pl.DataFrame:
+        table_expr = expr.as_table()
+        lf = self._to_lazyframe(table_expr, params=params, limit=limit, **kwargs)
         df = lf.collect(streaming=streaming, engine=engine)
         # XXX: Polars sometimes returns data with the incorrect column names.
         # For now we catch this case and rename them here if needed.
@@ -557,9 +568,55 @@ class Backend(BaseBackend, NoUrl):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+        pa = self._import_pyarrow()
+
+        if kwargs.get("engine", "cpu") != "cpu":
+            table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
+            return table.to_reader(chunk_size)
+
+        kwargs.pop("streaming", None)
+        kwargs.pop("engine", None)
+
+        schema = expr.as_table().schema()
+        lf = self._to_lazyframe(expr, params=params, limit=limit, **kwargs)
+        return pa.ipc.RecordBatchReader.from_batches(
+            schema.to_pyarrow(),
+            self._stream_batches(lf, schema=schema, chunk_size=chunk_size),
+        )
+
+    def _stream_batches(
+        self, lf: pl.LazyFrame, *, schema: sch.Schema, chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """Execute `lf` with the streaming engine and yield its record batches.
+
+        The result is sunk into an uncompressed temporary Arrow IPC file which
+        is then memory-mapped and read back one record batch at a time, so the
+        result never needs to fit in memory. Plans the streaming engine cannot
+        sink are collected in memory instead.
+        """
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        names = list(schema.names)
+        # batches may still map the file on Windows once the generator finishes
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+            path = Path(tmpdir) / "result.arrow"
+            try:
+                lf.sink_ipc(path, compression=None)
+            except pl.exceptions.InvalidOperationError:
+                batches = lf.collect().to_arrow().to_batches()
+            else:
+                source = pa.memory_map(str(path))
+                batches = pa.ipc.open_file(source)
+                batches = map(batches.get_batch, range(batches.num_record_batches))
+
+            for batch in batches:
+                # XXX: Polars sometimes returns data with the incorrect column
+                # names, so rename them positionally
+                table = pa.Table.from_batches([batch]).rename_columns(names)
+                table = PyArrowData.convert_table(table, schema)
+                yield from table.to_batches(max_chunksize=chunk_size)
 
     def _create_cached_table(self, name, expr):
         return self.create_table(name, self.compile(expr).cache())
@@ -76,3 +76,19 @@ def test_engine(con, mocker, to_method):
     mocked_collect = mocker.patch("polars.LazyFrame.collect")
     getattr(con, to_method)(t, engine="gpu")
     mocked_collect.assert_called_once_with(streaming=False, engine="gpu")
+
+
+def test_to_pyarrow_batches_sinks(con, mocker):
+    t = ibis.memtable({"a": range(10), "b": list("abcdefghij")})
+    expr = t.filter(t.a > 1).mutate(c=t.a * 2)
+
+    sink = mocker.spy(pl.LazyFrame, "sink_ipc")
+    collect = mocker.spy(pl.LazyFrame, "collect")
+
+    with con.to_pyarrow_batches(expr, chunk_size=3) as reader:
+        batches = list(reader)
+
+    sink.assert_called_once()
+    collect.assert_not_called()
+    assert [len(batch) for batch in batches] == [3, 3, 2]
+    assert all(batch.schema == expr.schema().to_pyarrow() for batch in batches)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import itertools
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
@@ -23,11 +24,11 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, CanListCatalog
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import TRUE, C, ColGen
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -35,6 +36,38 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
 
+# types whose Arrow CSV rendering is valid Postgres input; UUIDs are left out
+# because pyarrow can't convert the `uuid.UUID` objects of pandas data
+_COPY_CSV_TYPES = (
+    dt.Boolean,
+    dt.Integer,
+    dt.Floating,
+    dt.Decimal,
+    dt.String,
+    dt.Date,
+    dt.Time,
+    dt.Timestamp,
+    dt.JSON,
+    dt.INET,
+    dt.MACADDR,
+)
+
+# psycopg type names of the columns decoded from binary COPY output
+_COPY_BINARY_TYPES = {
+    dt.Boolean: "bool",
+    dt.Int8: "int2",
+    dt.Int16: "int2",
+    dt.Int32: "int4",
+    dt.Int64: "int8",
+    dt.Float32: "float4",
+    dt.Float64: "float8",
+    dt.String: "text",
+    dt.Binary: "bytea",
+    dt.Date: "date",
+    dt.Time: "time",
+}
+
+
 class NatDumper(psycopg.adapt.Dumper):
     def dump(self, obj, context: Any | None = None) -> str | None:
         return None
@@ -44,6 +77,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
     name = "postgres"
     compiler = sc.postgres.compiler
     supports_python_udfs = True
+    _bind_paramstyle = "format"
 
     def _from_url(self, url: ParseResult, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -114,6 +148,17 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         )
         create_stmt_sql = create_stmt.sql(self.dialect)
 
+        if self._can_copy_in(schema):
+            with self.begin() as cur:
+                cur.execute(create_stmt_sql)
+                self._copy_in(
+                    cur,
+                    sg.table(name, quoted=quoted),
+                    op,
+                    columns=schema.names,
+                )
+            return
+
         df = op.data.to_frame()
         # nan gets compiled into 'NaN'::float which throws errors in non-float columns
         # In order to hold NaN values, pandas automatically converts integer columns
@@ -134,6 +179,54 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             cur.execute(create_stmt_sql)
             cur.executemany(sql, data)
 
+    def _can_copy_in(self, schema: sch.Schema) -> bool:
+        """Whether every column of `schema` round-trips through CSV `COPY`."""
+        return all(isinstance(dtype, _COPY_CSV_TYPES) for dtype in schema.types)
+
+    def _copy_in(
+        self,
+        cur: psycopg.Cursor,
+        table: sge.Table,
+        op: ops.InMemoryTable,
+        *,
+        columns: Iterable[str],
+        chunk_size: int = 100_000,
+    ) -> None:
+        """Stream the rows of `op` into `table` using `COPY ... FROM STDIN`.
+
+        The data is encoded as CSV straight from Arrow, `chunk_size` rows at a
+        time, so no intermediate pandas or Python row objects are created.
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pcsv
+
+        from ibis.formats.pandas import PandasDataFrameProxy
+
+        quoted = self.compiler.quoted
+        target = sge.Schema(
+            this=table,
+            expressions=[sg.to_identifier(col, quoted=quoted) for col in columns],
+        ).sql(self.dialect)
+        options = pcsv.WriteOptions(include_header=False)
+        data = op.data.to_pyarrow(op.schema)
+        if isinstance(op.data, PandasDataFrameProxy):
+            # pyarrow turns NaN into null, keep it in floating point columns
+            df = op.data.obj
+            for i, field in enumerate(data.schema):
+                if pa.types.is_floating(field.type):
+                    column = pa.array(
+                        df[field.name], type=field.type, from_pandas=False
+                    )
+                    data = data.set_column(i, field, column)
+
+        # nulls are written as unquoted empty fields and empty strings as
+        # quoted ones, which is what the CSV format of COPY expects
+        with cur.copy(f"COPY {target} FROM STDIN (FORMAT CSV)") as copy:
+            for batch in data.to_batches(max_chunksize=chunk_size):
+                sink = pa.BufferOutputStream()
+                pcsv.write_csv(batch, sink, options)
+                copy.write(sink.getvalue())
+
     @contextlib.contextmanager
     def begin(self):
         con = self.con
@@ -169,6 +262,179 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         df = PostgresPandasData.convert_table(df, schema)
         return df
 
+    def _copy_types(
+        self, schema: sch.Schema, params: Mapping[ir.Scalar, Any] | None
+    ) -> list[str] | None:
+        """Return the binary COPY type names of `schema`.
+
+        Returns `None` if the results must be fetched through a cursor instead,
+        either because a column type has no fixed binary representation that
+        pyarrow can ingest or because the parameters must be bound.
+        """
+        if params and ibis.options.sql.bind_params:
+            # COPY statements cannot be prepared with bound parameters
+            return None
+        types = []
+        for dtype in schema.types:
+            if dtype.is_timestamp():
+                typename = "timestamptz" if dtype.timezone is not None else "timestamp"
+            elif (typename := _COPY_BINARY_TYPES.get(type(dtype))) is None:
+                return None
+            elif typename == "text" and self.con.info.encoding != "utf-8":
+                # text is sent in the client encoding, Arrow requires UTF-8
+                return None
+            types.append(typename)
+        return types
+
+    def _copy_query(
+        self,
+        expr: ir.Table,
+        *,
+        types: list[str],
+        params: Mapping[ir.Scalar, Any] | None,
+        limit: int | str | None,
+    ) -> str:
+        # the binary format depends on the exact column types, so cast every
+        # column to the type it is decoded as
+        quoted = self.compiler.quoted
+        columns = ", ".join(
+            sge.Cast(
+                this=sg.column(name, quoted=quoted),
+                to=sge.DataType.build(typename, dialect=self.dialect),
+            )
+            .as_(name, quoted=quoted)
+            .sql(self.dialect)
+            for name, typename in zip(expr.columns, types)
+        )
+        # compile the query itself through the compiled SQL cache
+        sql = self.compile(expr, limit=limit, params=params)
+        query = f'SELECT {columns} FROM ({sql}) AS "t"'  # noqa: S608
+        return f"COPY ({query}) TO STDOUT (FORMAT BINARY)"
+
+    def _copy_batches(
+        self, query: str, *, types: list[str], schema: pa.Schema, chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the results of a binary `COPY ... TO STDOUT` as record batches.
+
+        The connection is busy until the results are exhausted or the
+        generator is closed.
+        """
+        from ibis.backends.postgres.converter import (
+            BinaryCopyDecoder,
+            iter_binary_copy_rows,
+        )
+
+        decoder = BinaryCopyDecoder(types, schema)
+        con = self.con
+        with con.cursor() as cursor:
+            try:
+                with cursor.copy(query) as copy:
+                    rows = iter_binary_copy_rows(copy)
+                    while chunk := list(itertools.islice(rows, chunk_size)):
+                        yield decoder.decode(chunk)
+            except BaseException:
+                con.rollback()
+                raise
+            else:
+                con.commit()
+
+    def execute(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame | pd.Series | Any:
+        """Execute an Ibis expression and return a pandas `DataFrame`, `Series`, or scalar.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute.
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            no limit. The default is in `ibis/config.py`.
+        kwargs
+            Keyword arguments
+        """
+        import pyarrow as pa
+
+        from ibis.backends.postgres.converter import PostgresPandasData
+
+        table = expr.as_table()
+        schema = table.schema()
+        if (types := self._copy_types(schema, params)) is None:
+            return super().execute(expr, params=params, limit=limit, **kwargs)
+
+        self._run_pre_execute_hooks(expr)
+        query = self._copy_query(table, types=types, params=params, limit=limit)
+        arrow_schema = schema.to_pyarrow()
+        batches = self._copy_batches(
+            query, types=types, schema=arrow_schema, chunk_size=1_000_000
+        )
+        result = pa.Table.from_batches(batches, schema=arrow_schema).to_pandas()
+        df = PostgresPandasData.convert_table(result, schema)
+        return expr.__pandas_result__(df)
+
+    @util.experimental
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return an iterator of PyArrow record batches.
+
+        Results are streamed from the server in PostgreSQL's binary `COPY`
+        format where the result types allow it. The connection cannot run
+        other queries until the returned reader is exhausted or closed.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        params
+            Mapping of scalar parameter expressions to value.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
+        import pyarrow as pa
+
+        table = expr.as_table()
+        schema = table.schema()
+        if (types := self._copy_types(schema, params)) is None:
+            return super().to_pyarrow_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
+            )
+
+        self._run_pre_execute_hooks(expr)
+        query = self._copy_query(table, types=types, params=params, limit=limit)
+        arrow_schema = schema.to_pyarrow()
+        return pa.ipc.RecordBatchReader.from_batches(
+            arrow_schema,
+            self._copy_batches(
+                query, types=types, schema=arrow_schema, chunk_size=chunk_size
+            ),
+        )
+
     @property
     def version(self):
         version = f"{self.con.info.server_version:0>6}"
@@ -181,6 +447,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         pieces.append(patch)
         return ".".join(map(str, pieces))
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str | None = None,
@@ -292,6 +559,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             return res[0]
         return res
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -466,6 +734,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         op = ops.udf.scalar.builtin(fake_func, database=database)
         return op
 
+    @cached_metadata
     def get_schema(
         self,
         name: str,
@@ -551,6 +820,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             with self._safe_raw_sql(drop_stmt):
                 pass
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -564,6 +834,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with self._safe_raw_sql(sql):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self,
         name: str,
@@ -587,6 +858,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with self._safe_raw_sql(sql):
             pass
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -634,15 +906,22 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         if temp:
             properties.append(sge.TemporaryProperty())
 
+        copy_op = None
         if obj is not None:
             if not isinstance(obj, ir.Expr):
                 table = ibis.memtable(obj)
             else:
                 table = obj
 
-            self._run_pre_execute_hooks(table)
-
-            query = self.compiler.to_sqlglot(table)
+            if isinstance(op := table.op(), ops.InMemoryTable) and self._can_copy_in(
+                op.schema
+            ):
+                # stream local data straight into the new table
+                copy_op = op
+                query = None
+            else:
+                self._run_pre_execute_hooks(table)
+                query = self.compiler.to_sqlglot(table)
         else:
             query = None
 
@@ -673,6 +952,8 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             if query is not None:
                 insert_stmt = sge.Insert(this=table_expr, expression=query).sql(dialect)
                 cur.execute(insert_stmt)
+            elif copy_op is not None:
+                self._copy_in(cur, table_expr, copy_op, columns=schema.names)
 
             if overwrite:
                 cur.execute(sge.Drop(kind="TABLE", this=this, exists=True).sql(dialect))
@@ -688,6 +969,59 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    def insert(
+        self,
+        name: str,
+        /,
+        obj: pd.DataFrame | ir.Table | list | dict,
+        *,
+        database: str | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Insert data into a table.
+
+        Local data is streamed into the table with `COPY ... FROM STDIN`;
+        table expressions are inserted with `INSERT ... SELECT`.
+
+        Parameters
+        ----------
+        name
+            The name of the table to which data needs will be inserted
+        obj
+            The source data or expression to insert
+        database
+            Name of the attached database that the table is located in.
+
+            For multi-level table hierarchies, you can pass in a dotted string
+            path like `"catalog.database"` or a tuple of strings like
+            `("catalog", "database")`.
+        overwrite
+            If `True` then replace existing contents of table
+        """
+        if not isinstance(obj, ir.Table):
+            obj = ibis.memtable(obj)
+
+        op = obj.op()
+        if not isinstance(op, ops.InMemoryTable) or not self._can_copy_in(op.schema):
+            super().insert(name, obj, database=database, overwrite=overwrite)
+            return
+
+        table_loc = self._to_sqlglot_table(database)
+        catalog, db = self._to_catalog_db_tuple(table_loc)
+
+        if overwrite:
+            self.truncate_table(name, database=(catalog, db))
+
+        # same column matching as `_build_insert_from_table`
+        target_cols = self.get_schema(name, catalog=catalog, database=db).keys()
+        source_cols = op.schema.keys()
+        columns = source_cols if source_cols <= target_cols else target_cols
+
+        table = sg.table(name, db=db, catalog=catalog, quoted=self.compiler.quoted)
+        with self.begin() as cur:
+            self._copy_in(cur, table, op, columns=columns)
+
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -704,6 +1038,10 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with self._safe_raw_sql(drop_stmt):
             pass
 
+    def _bind_params(self, values: list[Any]) -> dict[str, Any]:
+        # use a named server-side prepared statement from the first execution
+        return {"params": values, "prepare": True}
+
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
         with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+import psycopg
+
 from ibis.formats.pandas import PandasData
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import pyarrow as pa
+    from psycopg.abc import Buffer
+
 
 class PostgresPandasData(PandasData):
     @classmethod
@@ -18,3 +29,180 @@ class PostgresPandasData(PandasData):
     @classmethod
     def convert_Binary(cls, s, dtype, pandas_type):
         return s.map(bytes, na_action="ignore")
+
+
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+_COPY_TRAILER = b"\xff\xff"
+
+# days and microseconds between the Unix epoch and the PostgreSQL epoch
+_PG_EPOCH_DAYS = 10_957
+_PG_EPOCH_MICROS = _PG_EPOCH_DAYS * 86_400 * 1_000_000
+
+# big endian layout of the fixed width values, along with their offset from
+# the Unix epoch
+_FIXED_WIDTH_TYPES = {
+    "bool": (np.dtype(">u1"), 0),
+    "int2": (np.dtype(">i2"), 0),
+    "int4": (np.dtype(">i4"), 0),
+    "int8": (np.dtype(">i8"), 0),
+    "float4": (np.dtype(">f4"), 0),
+    "float8": (np.dtype(">f8"), 0),
+    "date": (np.dtype(">i4"), _PG_EPOCH_DAYS),
+    "time": (np.dtype(">i8"), 0),
+    "timestamp": (np.dtype(">i8"), _PG_EPOCH_MICROS),
+    "timestamptz": (np.dtype(">i8"), _PG_EPOCH_MICROS),
+}
+_VARIABLE_WIDTH_TYPES = frozenset({"text", "bytea"})
+
+BINARY_COPY_TYPES = _FIXED_WIDTH_TYPES.keys() | _VARIABLE_WIDTH_TYPES
+"""Type names whose binary `COPY` representation `BinaryCopyDecoder` decodes."""
+
+_INT16 = np.dtype(">i2")
+_INT32 = np.dtype(">i4")
+
+
+def iter_binary_copy_rows(messages: Iterable[Buffer]) -> Iterator[Buffer]:
+    """Yield the rows of a binary `COPY ... TO STDOUT` stream.
+
+    The server sends every row in a message of its own, the first one prefixed
+    with the header of the format and the last message being its trailer.
+    """
+    messages = iter(messages)
+    if (first := next(messages, None)) is None:
+        return
+    if bytes(first[: len(_COPY_SIGNATURE)]) != _COPY_SIGNATURE:
+        raise psycopg.DataError("binary copy doesn't start with the expected signature")
+    if (first := first[len(_COPY_SIGNATURE) :]) != _COPY_TRAILER:
+        yield first
+    for message in messages:
+        if message != _COPY_TRAILER:
+            yield message
+
+
+def _gather(data: np.ndarray, offsets: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Read one big endian value of `dtype` at each of `offsets` into `data`."""
+    values = data[offsets[:, None] + np.arange(dtype.itemsize)]
+    return values.view(dtype).ravel().astype(dtype.newbyteorder("="))
+
+
+class BinaryCopyDecoder:
+    """Decode rows of PostgreSQL's binary `COPY` format into Arrow record batches.
+
+    The rows of a batch are concatenated into a single buffer and every
+    column is extracted from it at once with vectorized numpy operations, the
+    values being written straight into Arrow buffers without creating Python
+    objects for them.
+
+    Parameters
+    ----------
+    types
+        PostgreSQL type names of the columns, as in `BINARY_COPY_TYPES`.
+    schema
+        Arrow schema of the decoded batches.
+    """
+
+    __slots__ = ("_types", "arrow_schema")
+
+    def __init__(self, types: Sequence[str], schema: pa.Schema) -> None:
+        import pyarrow as pa
+
+        self.arrow_schema = schema
+        self._types = []
+        for typename, field in zip(types, schema):
+            # temporal values are sent at microsecond precision
+            if pa.types.is_timestamp(typ := field.type):
+                typ = pa.timestamp("us", tz=typ.tz)
+            elif pa.types.is_time(typ):
+                typ = pa.time64("us")
+            self._types.append((typename, typ))
+
+    def decode(self, rows: Sequence[Buffer]) -> pa.RecordBatch:
+        """Decode `rows`, each a single row of binary `COPY` output."""
+        import pyarrow as pa
+
+        n = len(rows)
+        sizes = np.fromiter(map(len, rows), dtype=np.int64, count=n)
+        # pad the data so that values of null fields can be gathered too
+        data = np.frombuffer(b"".join(rows) + bytes(8), dtype=np.uint8)
+        positions = np.zeros(n, dtype=np.int64)
+        np.cumsum(sizes[:-1], out=positions[1:])
+        ends = positions + sizes
+
+        if (_gather(data, positions, _INT16) != len(self._types)).any():
+            raise psycopg.DataError("unexpected number of fields in binary copy row")
+        positions += _INT16.itemsize
+
+        arrays = []
+        for (typename, typ), field in zip(self._types, self.arrow_schema):
+            lengths = _gather(data, positions, _INT32).astype(np.int64)
+            starts = positions + _INT32.itemsize
+            valid = lengths >= 0
+            np.maximum(lengths, 0, out=lengths)
+            positions = starts + lengths
+            if (positions > ends).any():
+                raise psycopg.DataError("binary copy field exceeds its row")
+
+            if typename in _VARIABLE_WIDTH_TYPES:
+                array = self._decode_variable_width(
+                    data, starts, lengths, valid, string=typename == "text"
+                )
+            else:
+                array = self._decode_fixed_width(data, starts, valid, typename, typ)
+            arrays.append(array.cast(field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.arrow_schema)
+
+    @staticmethod
+    def _decode_fixed_width(
+        data: np.ndarray,
+        starts: np.ndarray,
+        valid: np.ndarray,
+        typename: str,
+        typ: pa.DataType,
+    ) -> pa.Array:
+        import pyarrow as pa
+
+        dtype, epoch = _FIXED_WIDTH_TYPES[typename]
+        values = _gather(data, starts, dtype)
+        if typename == "bool":
+            values = values != 0
+        elif epoch:
+            info = np.iinfo(values.dtype)
+            if ((values == info.max) | (values == info.min))[valid].any():
+                raise psycopg.DataError(f"infinite {typename} values are not supported")
+            values += epoch
+        array = pa.array(values, mask=None if valid.all() else ~valid)
+        return array.view(typ) if pa.types.is_temporal(typ) else array
+
+    @staticmethod
+    def _decode_variable_width(
+        data: np.ndarray,
+        starts: np.ndarray,
+        lengths: np.ndarray,
+        valid: np.ndarray,
+        *,
+        string: bool,
+    ) -> pa.Array:
+        import pyarrow as pa
+
+        n = len(starts)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # select the bytes of the values by marking where each one starts and
+        # ends, since they are laid out in order in the data
+        nonempty = lengths > 0
+        marks = np.zeros(len(data) + 1, dtype=np.int8)
+        marks[starts[nonempty]] = 1
+        marks[starts[nonempty] + lengths[nonempty]] = -1
+        values = data[np.cumsum(marks[:-1], dtype=np.int8).view(np.bool_)]
+
+        null_count = n - int(np.count_nonzero(valid))
+        validity = (
+            pa.py_buffer(np.packbits(valid, bitorder="little")) if null_count else None
+        )
+        return pa.Array.from_buffers(
+            pa.large_string() if string else pa.large_binary(),
+            n,
+            [validity, pa.py_buffer(offsets), pa.py_buffer(values)],
+            null_count=null_count,
+        )
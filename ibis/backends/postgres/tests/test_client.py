@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import os
 import string
+import uuid
+from datetime import date, time
 from urllib.parse import quote_plus
 
 import hypothesis as h
@@ -452,3 +454,135 @@ def test_create_table_overwrite(con, tmp_db):
     name = gen_name("overwrite_test")
     t = con.create_table(name, schema={"id": "int32"}, database=tmp_db, overwrite=True)
     assert t.schema() == ibis.schema({"id": dt.int32})
+
+
+def test_binary_copy_matches_cursor_fetch(con, alltypes, monkeypatch):
+    expr = alltypes.select(
+        "id",
+        "bool_col",
+        "smallint_col",
+        "float_col",
+        "double_col",
+        "string_col",
+        "timestamp_col",
+        date=alltypes.timestamp_col.date(),
+        maybe_null=ibis.ifelse(alltypes.id % 2 == 0, alltypes.double_col, None),
+    ).order_by("id")
+    assert con._copy_types(expr.schema(), None) is not None
+
+    batches = list(con.to_pyarrow_batches(expr, chunk_size=1000))
+    assert all(len(batch) <= 1000 for batch in batches)
+    result = con.to_pyarrow(expr)
+    df = con.execute(expr)
+
+    monkeypatch.setattr(con, "_copy_types", lambda *_: None)
+    assert result.equals(con.to_pyarrow(expr))
+    tm.assert_frame_equal(df, con.execute(expr))
+
+
+def test_binary_copy_decoder():
+    import struct
+
+    import pyarrow as pa
+
+    from ibis.backends.postgres.converter import (
+        BinaryCopyDecoder,
+        iter_binary_copy_rows,
+    )
+
+    def encode(*fields):
+        row = struct.pack(">h", len(fields))
+        for field in fields:
+            if field is None:
+                row += struct.pack(">i", -1)
+            else:
+                row += struct.pack(">i", len(field)) + field
+        return row
+
+    header = b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+    hour = struct.pack(">q", 3_600_000_000)
+    messages = [
+        header + encode(struct.pack(">q", 1), b"a", struct.pack(">i", 0), hour),
+        encode(None, b"", None, None),
+        encode(struct.pack(">q", -3), None, struct.pack(">i", -10_957), bytes(8)),
+        b"\xff\xff",
+    ]
+    schema = pa.schema(
+        [
+            ("x", pa.int64()),
+            ("y", pa.string()),
+            ("z", pa.date32()),
+            ("t", pa.time64("ns")),
+        ]
+    )
+    decoder = BinaryCopyDecoder(["int8", "text", "date", "time"], schema)
+    batch = decoder.decode(list(iter_binary_copy_rows(messages)))
+
+    assert batch.schema == schema
+    assert batch.to_pydict() == {
+        "x": [1, None, -3],
+        "y": ["a", "", None],
+        "z": [date(2000, 1, 1), None, date(1970, 1, 1)],
+        "t": [time(1), None, time(0)],
+    }
+
+
+def test_copy_from_local_data(con, temp_table):
+    df = pd.DataFrame(
+        {
+            "a": [1, None, 3],
+            "s": ["x", "", None],
+            "f": [1.5, None, float("inf")],
+            "ts": pd.to_datetime(["2020-01-01", None, "2020-01-03 04:05:06.789"]),
+        }
+    )
+    assert con._can_copy_in(ibis.memtable(df).op().schema)
+
+    t = con.create_table(temp_table, df)
+    con.insert(temp_table, df.iloc[:1])
+
+    result = t.order_by(t.a.asc(nulls_first=True), "s").to_pandas()
+    assert len(result) == 4
+    assert result.s.isna().sum() == 1
+    assert (result.s == "").sum() == 1
+
+    assert con.execute(ibis.memtable(df).a.sum()) == 4
+
+
+def test_copy_from_pandas_preserves_nan(con, temp_table):
+    df = pd.DataFrame({"f": [1.5, np.nan], "s": ["x", np.nan]})
+    t = con.create_table(temp_table, df)
+    con.insert(temp_table, df)
+
+    result = t.to_pyarrow()
+    assert result["f"].null_count == 0
+    assert result["f"].to_pylist().count(1.5) == 2
+    assert result["s"].null_count == 2
+
+
+def test_uuid_memtable_skips_copy(con):
+    df = pd.DataFrame({"u": [uuid.uuid4(), None]})
+    t = ibis.memtable(df, schema={"u": "uuid"})
+    assert not con._can_copy_in(t.op().schema)
+    assert con.execute(t.u.notnull().sum()) == 1
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize("method", ["copy", "cursor"])
+def test_postgres_to_pyarrow(benchmark, con, monkeypatch, method):
+    expr = con.sql(
+        """
+        SELECT
+          i AS id,
+          i * 1.5 AS value,
+          'name' || i AS name,
+          i % 2 = 0 AS flag,
+          TIMESTAMP '2020-01-01' + i * INTERVAL '1 second' AS ts
+        FROM generate_series(1, 500000) AS i
+        """
+    )
+    if method == "cursor":
+        monkeypatch.setattr(con, "_copy_types", lambda *_: None)
+
+    result = benchmark(con.to_pyarrow, expr)
+    assert result.num_rows == 500_000
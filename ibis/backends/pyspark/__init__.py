@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+import datetime
+import itertools
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -12,7 +14,13 @@ import sqlglot.expressions as sge
 from packaging.version import parse as vparse
 from pyspark import SparkConf
 from pyspark.sql import SparkSession
-from pyspark.sql.types import BooleanType, DoubleType, LongType, StringType
+from pyspark.sql.types import (
+    BooleanType,
+    DoubleType,
+    LongType,
+    StringType,
+    TimestampType,
+)
 
 import ibis.backends.sql.compilers as sc
 import ibis.common.exceptions as com
@@ -24,7 +32,7 @@ from ibis import util
 from ibis.backends import CanCreateDatabase, CanListCatalog
 from ibis.backends.pyspark.converter import PySparkPandasData
 from ibis.backends.pyspark.datatypes import PySparkSchema, PySparkType
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import AlterTable, RenameTable
 from ibis.expr.operations.udf import InputType
 from ibis.legacy.udf.vectorized import _coerce_to_series
@@ -54,6 +62,7 @@ if TYPE_CHECKING:
 PYSPARK_VERSION = vparse(pyspark.__version__)
 PYSPARK_LT_34 = PYSPARK_VERSION < vparse("3.4")
 PYSPARK_LT_35 = PYSPARK_VERSION < vparse("3.5")
+PYSPARK_LT_40 = PYSPARK_VERSION < vparse("4.0")
 ConnectionMode = Literal["streaming", "batch"]
 
 
@@ -102,6 +111,14 @@ def _interval_to_string(interval):
     return f"{interval.op().value} {interval.op().dtype.unit.name.lower()}"
 
 
+def _timestamps_to_utc(row, indices):
+    row = list(row)
+    for i in indices:
+        if (value := row[i]) is not None:
+            row[i] = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return row
+
+
 class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
     name = "pyspark"
     compiler = sc.pyspark.compiler
@@ -133,6 +150,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         super().__init__(*args, **kwargs)
         self._cached_dataframes = {}
 
+    @invalidates_metadata
     def do_connect(
         self,
         session: SparkSession | None = None,
@@ -175,6 +193,10 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
         self._session = session
 
+        # mapping of udf names to the definitions registered with the session,
+        # so that udfs are registered once instead of per query
+        self._registered_udfs = {}
+
         # Spark internally stores timestamps as UTC values, and timestamp data
         # that is brought in without a specified time zone is converted as
         # local time to UTC with microsecond resolution.
@@ -361,6 +383,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             ]
         return self._filter_with_like(databases, like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
     ) -> list[str]:
@@ -396,9 +419,21 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         return wrapper
 
     def _register_udfs(self, expr: ir.Expr) -> None:
-        node = expr.op()
-        for udf in node.find(ops.ScalarUDF):
+        facts = expr.op().__facts__
+        registered = self._registered_udfs
+
+        def is_registered(name, definition):
+            # the session already has this exact definition
+            return registered.get(name) == definition
+
+        def register(name, definition, spark_udf):
+            self._session.udf.register(name, spark_udf)
+            registered[name] = definition
+
+        for udf in facts.udfs:
             udf_name = self.compiler.__sql_name__(udf)
+            if is_registered(udf_name, type(udf)):
+                continue
             udf_return = PySparkType.from_ibis(udf.dtype)
             if udf.__input_type__ == InputType.PANDAS:
                 udf_func = self._wrap_udf_to_return_pandas(udf.__func__, udf.dtype)
@@ -417,31 +452,69 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             else:
                 # Builtin functions don't need to be registered
                 continue
-            self._session.udf.register(udf_name, spark_udf)
-        for udf in node.find(ops.ElementWiseVectorizedUDF):
+            register(udf_name, type(udf), spark_udf)
+
+        for udf in facts.find(ops.ElementWiseVectorizedUDF):
             udf_name = self.compiler.__sql_name__(udf)
+            definition = (type(udf), udf.func, udf.return_type)
+            if is_registered(udf_name, definition):
+                continue
             udf_func = self._wrap_udf_to_return_pandas(udf.func, udf.return_type)
             udf_return = PySparkType.from_ibis(udf.return_type)
             spark_udf = F.pandas_udf(udf_func, udf_return, F.PandasUDFType.SCALAR)
-            self._session.udf.register(udf_name, spark_udf)
+            register(udf_name, definition, spark_udf)
 
-        for udf in node.find(ops.ReductionVectorizedUDF):
+        for udf in facts.find(ops.ReductionVectorizedUDF):
             udf_name = self.compiler.__sql_name__(udf)
-            udf_func = self._wrap_udf_to_return_pandas(udf.func, udf.return_type)
+            definition = (type(udf), udf.func, udf.return_type)
+            if is_registered(udf_name, definition):
+                continue
             udf_func = udf.func
             udf_return = PySparkType.from_ibis(udf.return_type)
             spark_udf = F.pandas_udf(udf_func, udf_return, F.PandasUDFType.GROUPED_AGG)
-            self._session.udf.register(udf_name, spark_udf)
+            register(udf_name, definition, spark_udf)
 
         for typ in (str, int, bool):
-            self._session.udf.register(f"unwrap_json_{typ.__name__}", unwrap_json(typ))
-        self._session.udf.register("unwrap_json_float", unwrap_json_float)
+            udf_name = f"unwrap_json_{typ.__name__}"
+            if not is_registered(udf_name, typ):
+                register(udf_name, typ, unwrap_json(typ))
+        if not is_registered("unwrap_json_float", float):
+            register("unwrap_json_float", float, unwrap_json_float)
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         schema = PySparkSchema.from_ibis(op.schema)
-        df = self._session.createDataFrame(data=op.data.to_frame(), schema=schema)
+        session = self._session
+        if not PYSPARK_LT_40:
+            # pyarrow tables are sent to the JVM as Arrow record batches
+            data = op.data.to_pyarrow(op.schema)
+            df = session.createDataFrame(data=data, schema=schema)
+        else:
+            with self._arrow_transfer():
+                df = session.createDataFrame(data=op.data.to_frame(), schema=schema)
         df.createOrReplaceTempView(op.name)
 
+    @contextlib.contextmanager
+    def _arrow_transfer(self):
+        """Send pandas data to classic Spark sessions as Arrow record batches.
+
+        Without Arrow enabled `createDataFrame` serializes pandas frames row by
+        row through Py4J. Spark Connect sessions always transfer Arrow.
+        """
+        if not isinstance(session := self._session, pyspark.sql.SparkSession):
+            yield
+            return
+
+        key = "spark.sql.execution.arrow.pyspark.enabled"
+        previous = session.conf.get(key, None)
+        session.conf.set(key, "true")
+        try:
+            yield
+        finally:
+            if previous is None:
+                session.conf.unset(key)
+            else:
+                session.conf.set(key, previous)
+
     def _finalize_memtable(self, name: str) -> None:
         """No-op, otherwise a deadlock can occur when using Spark Connect."""
         if isinstance(session := self._session, pyspark.sql.SparkSession):
@@ -478,6 +551,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             result = PySparkPandasData.convert_table(df, schema)
         return expr.__pandas_result__(result)
 
+    @invalidates_metadata
     def create_database(
         self,
         name: str,
@@ -518,6 +592,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             with self._safe_raw_sql(sql):
                 pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> Any:
@@ -544,6 +619,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             with self._safe_raw_sql(sql):
                 pass
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -587,6 +663,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
         return sch.Schema(struct)
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -662,6 +739,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
         return self.table(name, database=(catalog, db))
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -701,6 +779,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             pass
         return self.table(name, database=database)
 
+    @invalidates_metadata
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
 
@@ -762,6 +841,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         t.unpersist()
         assert not t.is_cached
 
+    @invalidates_metadata
     def read_delta(
         self,
         path: str | Path,
@@ -799,6 +879,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         spark_df.createOrReplaceTempView(table_name)
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_parquet(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -832,6 +913,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         spark_df.createOrReplaceTempView(table_name)
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_csv(
         self,
         paths: str | list[str] | tuple[str],
@@ -875,6 +957,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         spark_df.createOrReplaceTempView(table_name)
         return self.table(table_name)
 
+    @invalidates_metadata
     def read_json(
         self,
         paths: str | Sequence[str],
@@ -966,18 +1049,45 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             raise NotImplementedError(
                 "PySpark in streaming mode does not support to_pyarrow"
             )
+        self._run_pre_execute_hooks(expr)
+        table_expr = expr.as_table()
+        sql = self.compile(table_expr, params=params, limit=limit, **kwargs)
+        with self._safe_raw_sql(sql) as query:
+            table = self._collect_arrow(query, table_expr.schema())
+        return expr.__pyarrow_result__(table)
+
+    def _collect_arrow(self, df, schema: sch.Schema) -> pa.Table:
+        """Collect the result of `df` into an Arrow table of `schema`.
+
+        The result is transferred from Spark as Arrow record batches, without
+        converting it to pandas, unless Spark can't represent a column's type
+        in Arrow.
+        """
         import pyarrow as pa
         import pyarrow_hotfix  # noqa: F401
+        from pyspark.sql.pandas.types import to_arrow_schema
 
         from ibis.formats.pyarrow import PyArrowData
 
-        table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs),
-            preserve_index=False,
-        )
-        table = PyArrowData.convert_table(output, table_expr.schema())
-        return expr.__pyarrow_result__(table)
+        try:
+            arrow_schema = to_arrow_schema(df.schema)
+        except (TypeError, NotImplementedError):
+            table = pa.Table.from_pandas(
+                PySparkPandasData.convert_table(df.toPandas(), schema),
+                preserve_index=False,
+            )
+        else:
+            if hasattr(df, "toArrow"):
+                # pyspark >= 4.0, both classic and connect sessions
+                table = df.toArrow()
+            elif hasattr(df, "_collect_as_arrow"):
+                table = pa.Table.from_batches(
+                    df._collect_as_arrow(), schema=arrow_schema
+                )
+            else:
+                # spark connect < 4.0
+                table, _ = df._to_table()
+        return PyArrowData.convert_table(table, schema)
 
     def to_pyarrow_batches(
         self,
@@ -994,13 +1104,34 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
                 "PySpark in streaming mode does not support to_pyarrow_batches"
             )
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
-        return pa.ipc.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
 
+        from ibis.formats.pyarrow import PyArrowRowDecoder
+
+        self._run_pre_execute_hooks(expr)
+        table_expr = expr.as_table()
+        sql = self.compile(table_expr, params=params, limit=limit, **kwargs)
+        decoder = PyArrowRowDecoder(table_expr.schema())
+
+        def batches():
+            df = self.raw_sql(sql)
+            # Spark returns TIMESTAMP values as naive datetimes in the local
+            # time zone of the Python process, they're stored as UTC
+            local = [
+                i
+                for i, field in enumerate(df.schema)
+                if isinstance(field.dataType, TimestampType)
+            ]
+            # toLocalIterator fetches a single partition at a time, so only
+            # that partition and the current chunk are held in memory
+            rows = df.toLocalIterator()
+            while chunk := list(itertools.islice(rows, chunk_size)):
+                if local:
+                    chunk = [_timestamps_to_utc(row, local) for row in chunk]
+                yield decoder.decode(chunk)
+
+        return pa.ipc.RecordBatchReader.from_batches(decoder.arrow_schema, batches())
+
+    @invalidates_metadata
     @util.experimental
     def read_kafka(
         self,
@@ -1118,6 +1249,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         sq.start()
         return sq
 
+    @invalidates_metadata
     @util.experimental
     def read_csv_dir(
         self,
@@ -1171,6 +1303,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         spark_df.createOrReplaceTempView(table_name)
         return self.table(table_name)
 
+    @invalidates_metadata
     @util.experimental
     def read_parquet_dir(
         self,
@@ -1227,6 +1360,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         spark_df.createOrReplaceTempView(table_name)
         return self.table(table_name)
 
+    @invalidates_metadata
     @util.experimental
     def read_json_dir(
         self,
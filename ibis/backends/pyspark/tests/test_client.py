@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from datetime import datetime
+
+import pyarrow as pa
+import pyspark.sql
 import pytest
 
 import ibis
@@ -54,3 +58,49 @@ def test_create_table_no_catalog(con):
 
     assert "t2" not in con.list_tables(database="default")
     assert con.current_database != "default"
+
+
+def test_to_pyarrow_skips_pandas(con, mocker):
+    spy = mocker.spy(pyspark.sql.DataFrame, "toPandas")
+
+    t = ibis.memtable({"a": [1, 2, None], "b": ["x", None, "z"]})
+    expr = t.mutate(ts=ibis.timestamp("2024-01-01 00:00:00"))
+
+    table = con.to_pyarrow(expr)
+    assert table.schema == expr.schema().to_pyarrow()
+    assert table.column("a").to_pylist() == [1, 2, None]
+
+    batches = list(con.to_pyarrow_batches(expr, chunk_size=2))
+    assert sum(batch.num_rows for batch in batches) == 3
+    assert all(batch.num_rows <= 2 for batch in batches)
+
+    assert spy.call_count == 0
+
+
+def test_to_pyarrow_batches_streams(con, mocker):
+    spy = mocker.spy(pyspark.sql.DataFrame, "toLocalIterator")
+
+    t = ibis.memtable({"a": list(range(10))})
+    expr = t.mutate(ts=ibis.timestamp("2024-01-01 12:00:00")).order_by("a")
+
+    reader = con.to_pyarrow_batches(expr, chunk_size=4)
+    assert spy.call_count == 0
+
+    batches = list(reader)
+    assert spy.call_count == 1
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+
+    table = pa.Table.from_batches(batches)
+    assert table.column("a").to_pylist() == list(range(10))
+    assert set(table.column("ts").to_pylist()) == {datetime(2024, 1, 1, 12)}
+
+
+def test_memtable_registered_once(con, mocker, monkeypatch):
+    monkeypatch.setattr(ibis.options, "dedup_memtables", True)
+    spy = mocker.spy(con, "_register_in_memory_table")
+
+    for _ in range(2):
+        t = ibis.memtable({"a": [1.5, float("nan"), 3.0], "b": ["x", None, "z"]})
+        assert con.execute(t.count()) == 3
+
+    assert spy.call_count == 1
@@ -6,6 +6,7 @@ import pytest
 import ibis
 from ibis.backends.pyspark import PYSPARK_LT_35
 from ibis.conftest import IS_SPARK_REMOTE
+from ibis.legacy.udf.vectorized import elementwise
 
 pytest.importorskip("pyspark")
 
@@ -34,6 +35,13 @@ def pyarrow_repeat(x: str, n: int) -> str:
     return x * n
 
 
+with pytest.warns(FutureWarning, match="v9.0"):
+
+    @elementwise(input_type=["string"], output_type="int64")
+    def str_length(s):
+        return s.str.len()
+
+
 def test_builtin_udf(t, df):
     result = t.mutate(repeated=repeat(t.str_col, 2)).execute()
     expected = df.assign(repeated=df.str_col * 2)
@@ -72,3 +80,16 @@ def test_illegal_udf_type(t):
         match="pyarrow UDFs are only supported in pyspark >= 3.5",
     ):
         expr.execute()
+
+
+def test_vectorized_udf_registered_once(con, t, df, mocker):
+    expr = t.mutate(length=str_length(t.str_col))
+    expected = df.assign(length=df.str_col.str.len())
+
+    result = expr.execute()
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+    spy = mocker.spy(con._session.udf, "register")
+    result = expr.execute()
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+    spy.assert_not_called()
@@ -21,7 +21,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, CanListCatalog
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import TRUE, C, ColGen
 from ibis.util import experimental
 
@@ -184,6 +184,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             return res[0]
         return res
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -287,6 +288,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             (schema,) = cur.fetchone()
         return schema
 
+    @cached_metadata
     def get_schema(
         self,
         name: str,
@@ -372,6 +374,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             with self._safe_raw_sql(drop_stmt):
                 pass
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -385,6 +388,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with self._safe_raw_sql(sql):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self,
         name: str,
@@ -408,6 +412,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with self._safe_raw_sql(sql):
             pass
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -429,6 +434,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
             yield result
 
+    @invalidates_metadata
     def do_connect(
         self,
         host: str | None = None,
@@ -503,6 +509,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             cur.execute("SET TIMEZONE = UTC")
             cur.execute("SET RW_IMPLICIT_FLUSH TO true;")
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
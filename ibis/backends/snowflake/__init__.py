@@ -29,7 +29,7 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateCatalog, CanCreateDatabase
 from ibis.backends.snowflake.converter import SnowflakePandasData
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import STAR
 
 if TYPE_CHECKING:
@@ -240,6 +240,7 @@ IMMUTABLE
 AS
 $$ {defn["source"]} $$"""
 
+    @invalidates_metadata
     def do_connect(self, create_object_udfs: bool = True, **kwargs: Any):
         """Connect to Snowflake.
 
@@ -545,6 +546,7 @@ $$ {defn["source"]} $$"""
                 for t in cur.fetch_arrow_batches()
             )
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -629,6 +631,7 @@ $$ {defn["source"]} $$"""
 
         return self._filter_with_like(schemata, like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -685,6 +688,7 @@ $$ {defn["source"]} $$"""
             pq.write_table(data, path, compression="zstd")
             self.read_parquet(path, table_name=name)
 
+    @invalidates_metadata
     def create_catalog(self, name: str, /, *, force: bool = False) -> None:
         current_catalog = self.current_catalog
         current_database = self.current_database
@@ -703,6 +707,7 @@ $$ {defn["source"]} $$"""
             # so we switch back to the original database and schema
             cur.execute(use_stmt)
 
+    @invalidates_metadata
     def drop_catalog(self, name: str, /, *, force: bool = False) -> None:
         current_catalog = self.current_catalog
         if name == current_catalog:
@@ -717,6 +722,7 @@ $$ {defn["source"]} $$"""
         with self._safe_raw_sql(drop_stmt):
             pass
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -757,6 +763,7 @@ $$ {defn["source"]} $$"""
         else:
             return cur
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -775,6 +782,7 @@ $$ {defn["source"]} $$"""
         with self._safe_raw_sql(drop_stmt):
             pass
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -870,6 +878,7 @@ $$ {defn["source"]} $$"""
 
         return self.table(name, database=(catalog, db))
 
+    @invalidates_metadata
     def read_csv(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -995,6 +1004,7 @@ $$ {defn["source"]} $$"""
 
         return self.table(table)
 
+    @invalidates_metadata
     def read_json(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -1083,6 +1093,7 @@ $$ {defn["source"]} $$"""
 
         return self.table(table)
 
+    @invalidates_metadata
     def read_parquet(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
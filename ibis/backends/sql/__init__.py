@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import abc
+import collections
+import functools
+import re
+import threading
+import time
+import uuid
+import weakref
 from functools import partial
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import sqlglot as sg
 import sqlglot.expressions as sge
 
 import ibis
 import ibis.common.exceptions as exc
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend
+from ibis.common.caching import CacheInfo, LRUCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     import pandas as pd
     import pyarrow as pa
@@ -25,12 +34,86 @@ if TYPE_CHECKING:
     from ibis.expr.schema import SchemaLike
 
 
+_MEMTABLE_INSERT_CHUNK_SIZE = 10_000
+"""Number of rows passed to each `executemany` call when uploading memtables."""
+
+
+class _MetadataWrites(threading.local):
+    def __init__(self) -> None:
+        self.running = collections.Counter()
+
+
+_metadata_writes = _MetadataWrites()
+"""Number of metadata modifying methods running on the current thread, by connection."""
+
+
+def cached_metadata(method: Callable) -> Callable:
+    """Serve the results of the backend method `method` from the metadata cache.
+
+    The cache is only used when `ibis.options.sql.metadata_cache_size` is
+    positive.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if (
+            not (cache_size := ibis.options.sql.metadata_cache_size)
+            or _metadata_writes.running[id(self)]
+        ):
+            return method(self, *args, **kwargs)
+
+        cache = self._metadata_cache
+        cache.maxsize = cache_size
+        cache.ttl = ibis.options.sql.metadata_cache_ttl
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache.get(key)
+        except TypeError:
+            # unhashable arguments
+            return method(self, *args, **kwargs)
+
+        if result is None:
+            result = method(self, *args, **kwargs)
+            cache.put(key, result)
+
+        # don't hand out the cached list
+        return list(result) if isinstance(result, list) else result
+
+    return wrapper
+
+
+def invalidates_metadata(method: Callable) -> Callable:
+    """Invalidate the metadata cache around calls to the backend method `method`."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # bypass the cache on this thread while the method runs, so that
+        # metadata read in between its statements is never stale
+        running = _metadata_writes.running
+        key = id(self)
+        running[key] += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            running[key] -= 1
+            if not running[key]:
+                del running[key]
+            if (cache := self.__dict__.get("_metadata_cache")) is not None:
+                cache.invalidate()
+
+    return wrapper
+
+
 class SQLBackend(BaseBackend):
     compiler: ClassVar[SQLGlotCompiler]
     name: ClassVar[str]
 
     _top_level_methods = ("from_connection",)
 
+    _bind_paramstyle: ClassVar[Literal["format", "qmark"] | None] = None
+    """The DB-API paramstyle used to bind scalar parameters, `None` if unsupported."""
+
     @property
     def dialect(self) -> sg.Dialect:
         """Return the SQL dialect used by the backend."""
@@ -132,11 +215,240 @@ class SQLBackend(BaseBackend):
         str
             Compiled expression
         """
-        query = self.compiler.to_sqlglot(expr, limit=limit, params=params)
-        sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+        if ibis.options.sql.compile_cache_size:
+            sql = self._compile_cached(expr, limit=limit, params=params, pretty=pretty)
+        else:
+            query = self.compiler.to_sqlglot(expr, limit=limit, params=params)
+            sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
         self._log(sql)
         return sql
 
+    @functools.cached_property
+    def _compile_cache(self) -> LRUCache:
+        return LRUCache(ibis.options.sql.compile_cache_size)
+
+    @functools.cached_property
+    def _untemplatable(self) -> weakref.WeakKeyDictionary:
+        """Compile options, by expression, that cannot use unbound parameters."""
+        return weakref.WeakKeyDictionary()
+
+    def compile_cache_info(self) -> CacheInfo:
+        """Return statistics of the compiled SQL cache of this connection.
+
+        The cache is enabled by setting `ibis.options.sql.compile_cache_size`
+        to a positive number.
+
+        Returns
+        -------
+        CacheInfo
+            Number of cache hits, misses and evictions, along with the maximum
+            and current number of cached queries.
+        """
+        return self._compile_cache.info()
+
+    @functools.cached_property
+    def _metadata_cache(self) -> LRUCache:
+        return LRUCache(
+            ibis.options.sql.metadata_cache_size,
+            ttl=ibis.options.sql.metadata_cache_ttl,
+        )
+
+    def metadata_cache_info(self) -> CacheInfo:
+        """Return statistics of the metadata cache of this connection.
+
+        The cache is enabled by setting `ibis.options.sql.metadata_cache_size`
+        to a positive number.
+
+        Returns
+        -------
+        CacheInfo
+            Number of cache hits, misses and evictions, along with the maximum
+            and current number of cached `get_schema` and `list_tables` results.
+        """
+        return self._metadata_cache.info()
+
+    def clear_metadata_cache(self) -> None:
+        """Flush the cached `get_schema` and `list_tables` results.
+
+        Use this after modifying tables or views without going through the
+        methods of this connection, for example with `raw_sql`.
+        """
+        self._metadata_cache.invalidate()
+
+    def _compile_cached(
+        self,
+        expr: ir.Expr,
+        *,
+        limit: str | int | None,
+        params: Mapping[ir.Expr, Any] | None,
+        pretty: bool,
+    ) -> str:
+        """Compile `expr` through the connection's compiled SQL cache.
+
+        Queries are cached as templates with every scalar parameter replaced by
+        a unique token, so repeated executions that only differ in parameter
+        values skip compilation and only render the parameter literals.
+        """
+        if (template := self._get_template(expr, limit=limit, pretty=pretty)) is None:
+            query = self.compiler.to_sqlglot(expr, limit=limit, params=params)
+            return query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+
+        sql, slots = template
+        if not slots:
+            return sql
+
+        values = self.compiler._prepare_params(params or {})
+        for token, param in slots:
+            sql = sql.replace(token, self._render_param(param, values[param]))
+        return sql
+
+    def _get_template(
+        self, expr: ir.Expr, *, limit: str | int | None, pretty: bool
+    ) -> tuple[str, tuple[tuple[str, ops.ScalarParameter], ...]] | None:
+        """Return the SQL template of `expr`, using the compiled SQL cache if enabled.
+
+        Returns `None` if the expression cannot be compiled with unbound
+        parameters.
+        """
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+
+        op = expr.op()
+        options = (limit, pretty, ibis.options.sql.fuse_selects)
+        if options in self._untemplatable.get(op, ()):
+            return None
+
+        if cache_size := ibis.options.sql.compile_cache_size:
+            cache = self._compile_cache
+            cache.maxsize = cache_size
+            key = (op, *options)
+            if (template := cache.get(key)) is not None:
+                return template
+
+        try:
+            template = self._compile_template(expr, limit=limit, pretty=pretty)
+        except exc.IbisError:
+            # some compilers reject unbound parameters where they require a
+            # literal value, remember it to compile the expression only once
+            self._untemplatable.setdefault(op, set()).add(options)
+            return None
+
+        if cache_size:
+            cache.put(key, template)
+        return template
+
+    def _compile_bound(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        limit: str | int | None = None,
+        params: Mapping[ir.Expr, Any] | None = None,
+        pretty: bool = False,
+    ) -> tuple[str, dict[str, Any]]:
+        """Compile `expr` for execution, binding scalar parameters if enabled.
+
+        If `ibis.options.sql.bind_params` is set and the backend's driver
+        supports it, scalar parameters are passed to the driver as bound
+        values instead of being inlined as literals, so that the server can
+        reuse the query plan across parameter values.
+
+        Returns
+        -------
+        tuple[str, dict[str, Any]]
+            The SQL string and the keyword arguments to pass to
+            `_safe_raw_sql` along with it.
+        """
+        paramstyle = self._bind_paramstyle
+        if paramstyle is None or not params or not ibis.options.sql.bind_params:
+            return self.compile(expr, limit=limit, params=params, pretty=pretty), {}
+
+        if (template := self._get_template(expr, limit=limit, pretty=pretty)) is None:
+            return self.compile(expr, limit=limit, params=params, pretty=pretty), {}
+
+        sql, slots = template
+        if not slots:
+            self._log(sql)
+            return sql, {}
+
+        values = self.compiler._prepare_params(params)
+        tokens = dict(slots)
+        if paramstyle == "format":
+            # literal percent signs must be escaped once parameters are passed
+            sql = sql.replace("%", "%%")
+            marker = sge.Var(this="%s")
+        else:
+            marker = sge.Var(this="?")
+
+        bound = []
+
+        def bind(match: re.Match) -> str:
+            param = tokens[match.group()]
+            value = values[param]
+            if self._can_bind(param.dtype):
+                bound.append(ops.Literal(value, dtype=param.dtype).value)
+                return self.compiler.cast(marker, param.dtype).sql(self.dialect)
+            rendered = self._render_param(param, value)
+            return rendered.replace("%", "%%") if paramstyle == "format" else rendered
+
+        # bind values in the order their placeholders appear in the SQL text
+        sql = re.sub("|".join(map(re.escape, tokens)), bind, sql)
+        self._log(sql)
+        return sql, self._bind_params(bound)
+
+    def _bind_params(self, values: list[Any]) -> dict[str, Any]:
+        """Return the `_safe_raw_sql` keyword arguments passing `values` to the driver."""
+        return {"params": values}
+
+    def _can_bind(self, dtype: dt.DataType) -> bool:
+        """Return whether values of `dtype` can be passed to the driver as-is."""
+        return (
+            dtype.is_boolean()
+            or dtype.is_numeric()
+            or dtype.is_string()
+            or dtype.is_binary()
+            or dtype.is_date()
+            or dtype.is_time()
+            or dtype.is_timestamp()
+        )
+
+    def _compile_template(
+        self, expr: ir.Expr, *, limit: int | None, pretty: bool
+    ) -> tuple[str, tuple[tuple[str, ops.ScalarParameter], ...]]:
+        from ibis.backends.sql.compilers.base import UNBOUND_PARAMS
+
+        found = expr.op().__facts__.find(ops.ScalarParameter)
+        params = {param.name: param for param in found}
+        if len(params) != len(found):
+            raise exc.IbisError("Scalar parameter names must be unique")
+
+        query = self.compiler.to_sqlglot(expr, limit=limit, params=UNBOUND_PARAMS)
+
+        nonce = uuid.uuid4().hex
+        tokens = {}
+
+        def tokenize(node):
+            if not isinstance(node, sge.Placeholder):
+                return node
+            name = node.name
+            if (token := tokens.get(name)) is None:
+                token = tokens[name] = f"__ibis_param_{nonce}_{name}__"
+            return sge.Var(this=token)
+
+        # the compiled tree shares subexpressions, so transform a copy of it
+        query = query.transform(tokenize)
+        sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+        slots = tuple((token, params[name]) for name, token in tokens.items())
+        return sql, slots
+
+    def _render_param(self, param: ops.ScalarParameter, value: Any) -> str:
+        literal = ops.Literal(value, dtype=param.dtype)
+        sql = self.compiler.visit_node(
+            literal, value=literal.value, dtype=literal.dtype
+        ).sql(dialect=self.dialect)
+        # guard against negative numbers binding to a surrounding operator
+        return f"({sql})" if sql.startswith("-") else sql
+
     def _log(self, sql: str) -> None:
         """Log `sql`.
 
@@ -203,7 +515,7 @@ class SQLBackend(BaseBackend):
     def _register_udfs(self, expr: ir.Expr) -> None:
         udf_sources = []
         compiler = self.compiler
-        for udf_node in expr.op().find(ops.ScalarUDF):
+        for udf_node in expr.op().__facts__.udfs:
             compile_func = getattr(
                 compiler, f"_compile_{udf_node.__input_type__.name.lower()}_udf"
             )
@@ -215,6 +527,7 @@ class SQLBackend(BaseBackend):
             with self._safe_raw_sql(";\n".join(udf_sources)):
                 pass
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -256,6 +569,7 @@ class SQLBackend(BaseBackend):
             pass
         return self.table(name, database=(catalog, db))
 
+    @invalidates_metadata
     def drop_view(
         self, name: str, /, *, database: str | None = None, force: bool = False
     ) -> None:
@@ -311,16 +625,17 @@ class SQLBackend(BaseBackend):
         """
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, params=params, limit=limit, **kwargs)
+        sql, bound = self._compile_bound(table, params=params, limit=limit, **kwargs)
 
         schema = table.schema()
 
         # TODO(kszucs): these methods should be abstractmethods or this default
         # implementation should be removed
-        with self._safe_raw_sql(sql) as cur:
+        with self._safe_raw_sql(sql, **bound) as cur:
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -360,9 +675,8 @@ class SQLBackend(BaseBackend):
     ) -> Iterable[list]:
         self._run_pre_execute_hooks(expr)
 
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
+        sql, bound = self._compile_bound(expr, limit=limit, params=params)
+        with self._safe_raw_sql(sql, **bound) as cursor:
             while batch := cursor.fetchmany(chunk_size):
                 yield batch
 
@@ -401,17 +715,16 @@ class SQLBackend(BaseBackend):
         """
         pa = self._import_pyarrow()
 
-        schema = expr.as_table().schema()
-        array_type = schema.as_struct().to_pyarrow()
-        arrays = (
-            pa.array(map(tuple, batch), type=array_type)
-            for batch in self._cursor_batches(
+        from ibis.formats.pyarrow import PyArrowRowDecoder
+
+        decoder = PyArrowRowDecoder(expr.as_table().schema())
+        batches = map(
+            decoder.decode,
+            self._cursor_batches(
                 expr, params=params, limit=limit, chunk_size=chunk_size
-            )
+            ),
         )
-        batches = map(pa.RecordBatch.from_struct_array, arrays)
-
-        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
+        return pa.ipc.RecordBatchReader.from_batches(decoder.arrow_schema, batches)
 
     def insert(
         self,
@@ -541,6 +854,58 @@ class SQLBackend(BaseBackend):
             ),
         ).sql(self.dialect)
 
+    def _memtable_insert_chunks(
+        self, op: ops.InMemoryTable, *, chunk_size: int = _MEMTABLE_INSERT_CHUNK_SIZE
+    ) -> Iterator[list[tuple]]:
+        """Yield the rows of `op` as lists of parameter tuples for `executemany`.
+
+        Rows are assembled from Arrow record batches one column at a time, with
+        floating point NaNs converted to NULL. Data that can't be converted to
+        Arrow goes through pandas instead.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        try:
+            table = op.data.to_pyarrow(op.schema)
+        except pa.ArrowException:
+            df = op.data.to_frame().replace(float("nan"), None)
+            for start, end in util.chunks(len(df), chunk_size=chunk_size):
+                yield list(df.iloc[start:end].itertuples(index=False))
+            return
+
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            if not batch.num_rows:
+                continue
+            columns = []
+            for column in batch.columns:
+                if pa.types.is_floating(column.type):
+                    column = pc.if_else(
+                        pc.is_nan(column), pa.scalar(None, column.type), column
+                    )
+                columns.append(column.to_pylist())
+            yield list(zip(*columns))
+
+    def _insert_memtable_chunks(
+        self,
+        op: ops.InMemoryTable,
+        insert: Callable[[list[tuple]], Any],
+    ) -> None:
+        """Call `insert` with every chunk of rows of `op` and log the throughput."""
+        nrows = 0
+        start = time.monotonic()
+        for rows in self._memtable_insert_chunks(op):
+            insert(rows)
+            nrows += len(rows)
+        elapsed = time.monotonic() - start
+
+        rate = nrows / elapsed if elapsed else float("inf")
+        self._log(
+            f"-- uploaded {nrows:d} rows to {op.name} in {elapsed:.3f}s "
+            f"({rate:,.0f} rows/s)"
+        )
+
+    @invalidates_metadata
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         """Delete all rows from a table.
 
@@ -672,5 +1037,20 @@ class SQLBackend(BaseBackend):
             f"pandas UDFs are not supported in the {self.dialect} backend"
         )
 
+    def _register_in_memory_tables(self, expr: ir.Expr) -> None:
+        # most queries only reference memtables that are already registered,
+        # which must not flush the metadata cache
+        memtables = expr.op().__facts__.memtables
+        if any(memtable not in self._memtables for memtable in memtables):
+            self._create_in_memory_tables(expr)
+
+    @invalidates_metadata
+    def _create_in_memory_tables(self, expr: ir.Expr) -> None:
+        super()._register_in_memory_tables(expr)
+
+    @invalidates_metadata
+    def _finalize_in_memory_table(self, name: str) -> None:
+        super()._finalize_in_memory_table(name)
+
     def _finalize_memtable(self, name: str) -> None:
         self.drop_table(name, force=True)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 __all__ = [
     "AthenaCompiler",
     "BigQueryCompiler",
@@ -22,22 +25,56 @@ __all__ = [
     "TrinoCompiler",
 ]
 
-from ibis.backends.sql.compilers.athena import AthenaCompiler
-from ibis.backends.sql.compilers.bigquery import BigQueryCompiler
-from ibis.backends.sql.compilers.clickhouse import ClickHouseCompiler
-from ibis.backends.sql.compilers.databricks import DatabricksCompiler
-from ibis.backends.sql.compilers.datafusion import DataFusionCompiler
-from ibis.backends.sql.compilers.druid import DruidCompiler
-from ibis.backends.sql.compilers.duckdb import DuckDBCompiler
-from ibis.backends.sql.compilers.exasol import ExasolCompiler
-from ibis.backends.sql.compilers.flink import FlinkCompiler
-from ibis.backends.sql.compilers.impala import ImpalaCompiler
-from ibis.backends.sql.compilers.mssql import MSSQLCompiler
-from ibis.backends.sql.compilers.mysql import MySQLCompiler
-from ibis.backends.sql.compilers.oracle import OracleCompiler
-from ibis.backends.sql.compilers.postgres import PostgresCompiler
-from ibis.backends.sql.compilers.pyspark import PySparkCompiler
-from ibis.backends.sql.compilers.risingwave import RisingWaveCompiler
-from ibis.backends.sql.compilers.snowflake import SnowflakeCompiler
-from ibis.backends.sql.compilers.sqlite import SQLiteCompiler
-from ibis.backends.sql.compilers.trino import TrinoCompiler
+# the dialect compilers are imported on first access, so that loading a backend
+# doesn't import the compilers of every other backend
+_COMPILER_MODULES = {
+    "AthenaCompiler": "athena",
+    "BigQueryCompiler": "bigquery",
+    "ClickHouseCompiler": "clickhouse",
+    "DatabricksCompiler": "databricks",
+    "DataFusionCompiler": "datafusion",
+    "DruidCompiler": "druid",
+    "DuckDBCompiler": "duckdb",
+    "ExasolCompiler": "exasol",
+    "FlinkCompiler": "flink",
+    "ImpalaCompiler": "impala",
+    "MSSQLCompiler": "mssql",
+    "MySQLCompiler": "mysql",
+    "OracleCompiler": "oracle",
+    "PostgresCompiler": "postgres",
+    "PySparkCompiler": "pyspark",
+    "RisingWaveCompiler": "risingwave",
+    "SnowflakeCompiler": "snowflake",
+    "SQLiteCompiler": "sqlite",
+    "TrinoCompiler": "trino",
+}
+
+if TYPE_CHECKING:
+    from ibis.backends.sql.compilers.athena import AthenaCompiler
+    from ibis.backends.sql.compilers.bigquery import BigQueryCompiler
+    from ibis.backends.sql.compilers.clickhouse import ClickHouseCompiler
+    from ibis.backends.sql.compilers.databricks import DatabricksCompiler
+    from ibis.backends.sql.compilers.datafusion import DataFusionCompiler
+    from ibis.backends.sql.compilers.druid import DruidCompiler
+    from ibis.backends.sql.compilers.duckdb import DuckDBCompiler
+    from ibis.backends.sql.compilers.exasol import ExasolCompiler
+    from ibis.backends.sql.compilers.flink import FlinkCompiler
+    from ibis.backends.sql.compilers.impala import ImpalaCompiler
+    from ibis.backends.sql.compilers.mssql import MSSQLCompiler
+    from ibis.backends.sql.compilers.mysql import MySQLCompiler
+    from ibis.backends.sql.compilers.oracle import OracleCompiler
+    from ibis.backends.sql.compilers.postgres import PostgresCompiler
+    from ibis.backends.sql.compilers.pyspark import PySparkCompiler
+    from ibis.backends.sql.compilers.risingwave import RisingWaveCompiler
+    from ibis.backends.sql.compilers.snowflake import SnowflakeCompiler
+    from ibis.backends.sql.compilers.sqlite import SQLiteCompiler
+    from ibis.backends.sql.compilers.trino import TrinoCompiler
+
+
+def __getattr__(name: str):
+    if (module := _COMPILER_MODULES.get(name)) is not None:
+        compiler = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+        return globals().setdefault(name, compiler)
+    elif name in _COMPILER_MODULES.values():
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
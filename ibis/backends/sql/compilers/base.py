@@ -7,6 +7,7 @@ import math
 import operator
 import string
 from functools import partial, reduce
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import sqlglot as sg
@@ -243,6 +244,9 @@ FALSE = sge.false()
 TRUE = sge.true()
 STAR = sge.Star()
 
+# passed as `params` to compile scalar parameters to named placeholders
+UNBOUND_PARAMS = MappingProxyType({})
+
 
 @public
 class SQLGlotCompiler(abc.ABC):
@@ -447,6 +451,7 @@ class SQLGlotCompiler(abc.ABC):
     # UPPERCASE values to handle inheritance, do not modify directly here.
     extra_supported_ops: ClassVar[frozenset[type[ops.Node]]] = frozenset()
     lowered_ops: ClassVar[dict[type[ops.Node], pats.Replace]] = {}
+    visitors: ClassVar[dict[type[ops.Node], Callable]] = {}
 
     def __init__(self) -> None:
         self.f = FuncGen(
@@ -509,6 +514,14 @@ class SQLGlotCompiler(abc.ABC):
             if not hasattr(cls, name):
                 setattr(cls, name, cls.visit_Undefined)
 
+        # resolve the visitor of every operation once, so `visit_node` only
+        # needs a dictionary lookup per node
+        #
+        # as a consequence translation rules must be defined in the class
+        # body: `visit_*` methods assigned to the class after its creation or
+        # to an instance are ignored, override them in a subclass instead
+        cls.visitors = {op: cls._lookup_visitor(op) for op in ALL_OPERATIONS}
+
         # Amend `lowered_ops` and `extra_supported_ops` using their
         # respective UPPERCASE classvar values.
         extra_supported_ops = set(cls.extra_supported_ops)
@@ -611,7 +624,8 @@ class SQLGlotCompiler(abc.ABC):
         op
             An ibis operation
         params
-            A mapping of expressions to concrete values
+            A mapping of expressions to concrete values. If `UNBOUND_PARAMS`,
+            scalar parameters are compiled to named placeholders.
         compiler
             An instance of SQLGlotCompiler
         translate_rel
@@ -625,9 +639,12 @@ class SQLGlotCompiler(abc.ABC):
             A sqlglot expression
 
         """
-        # substitute parameters immediately to avoid having to define a
-        # ScalarParameter translation rule
-        params = self._prepare_params(params)
+        # substitute parameters immediately, unbound parameters are rendered
+        # by visit_ScalarParameter
+        if params is UNBOUND_PARAMS:
+            params = None
+        else:
+            params = self._prepare_params(params)
         if self.lowered_ops:
             op = op.replace(reduce(operator.or_, self.lowered_ops.values()))
         op, ctes = sqlize(
@@ -654,7 +671,10 @@ class SQLGlotCompiler(abc.ABC):
 
             alias = sg.to_identifier(alias, quoted=self.quoted)
             if isinstance(result, sge.Subquery):
-                return result.as_(alias, quoted=self.quoted)
+                # only copy results that are passed through from a child, e.g.
+                # self references, copying fresh ones is expensive and useless
+                copy = any(result is value for value in kwargs.values())
+                return result.as_(alias, quoted=self.quoted, copy=copy)
             else:
                 try:
                     return result.subquery(alias, copy=False)
@@ -680,19 +700,31 @@ class SQLGlotCompiler(abc.ABC):
 
         return out
 
+    @classmethod
+    def _lookup_visitor(cls, op: type[ops.Node]) -> Callable | None:
+        if issubclass(op, ops.ScalarUDF):
+            return cls.visit_ScalarUDF
+        elif issubclass(op, ops.AggUDF):
+            return cls.visit_AggUDF
+        else:
+            return getattr(cls, f"visit_{op.__name__}", None)
+
     def visit_node(self, op: ops.Node, **kwargs):
-        if isinstance(op, ops.ScalarUDF):
-            return self.visit_ScalarUDF(op, **kwargs)
-        elif isinstance(op, ops.AggUDF):
-            return self.visit_AggUDF(op, **kwargs)
+        # operations created after the compiler class, e.g. user defined
+        # functions, are looked up on demand; see `__init_subclass__` for why
+        # `visit_*` methods can't be patched onto a compiler
+        typ = type(op)
+        if (method := self.visitors.get(typ)) is None:
+            method = self._lookup_visitor(typ)
+        if method is not None:
+            return method(self, op, **kwargs)
         else:
-            method = getattr(self, f"visit_{type(op).__name__}", None)
-            if method is not None:
-                return method(op, **kwargs)
-            else:
-                raise com.OperationNotDefinedError(
-                    f"No translation rule for {type(op).__name__}"
-                )
+            raise com.OperationNotDefinedError(
+                f"No translation rule for {typ.__name__}"
+            )
+
+    def visit_ScalarParameter(self, op, *, dtype, counter):
+        return sge.Placeholder(this=op.name)
 
     def visit_Field(self, op, *, rel, name):
         return sg.column(
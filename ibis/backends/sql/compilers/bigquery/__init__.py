@@ -238,11 +238,9 @@ class BigQueryCompiler(SQLGlotCompiler):
         """
         sql = super().to_sqlglot(expr, limit=limit, params=params)
 
-        table_expr = expr.as_table()
+        facts = expr.as_table().op().__facts__
 
-        memtable_names = frozenset(
-            op.name for op in table_expr.op().find(ops.InMemoryTable)
-        )
+        memtable_names = frozenset(op.name for op in facts.memtables)
 
         result = sql.transform(
             _qualify_memtable,
@@ -253,7 +251,7 @@ class BigQueryCompiler(SQLGlotCompiler):
 
         sources = []
 
-        for udf_node in table_expr.op().find(ops.ScalarUDF):
+        for udf_node in facts.udfs:
             compile_func = getattr(
                 self, f"_compile_{udf_node.__input_type__.name.lower()}_udf"
             )
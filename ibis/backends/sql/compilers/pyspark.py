@@ -29,7 +29,7 @@ from ibis.util import gen_name
 
 
 @replace(p.Limit)
-def offset_to_filter(_):
+def offset_to_filter(_, **kwargs):
     # spark doesn't support dynamic limit, so raise an error if either limit or
     # offset is not a literal expression
     if isinstance(_.n, ops.Value) and _.n.find(ops.Relation):
@@ -213,7 +213,7 @@ def remove_aliases(_, **kwargs):
     return _.arg
 
 
-def complexity(node):
+def complexity(node, scores=None):
     """Assign a complexity score to a node.
 
     Subsequent projections can be merged into a single projection by replacing
@@ -226,22 +226,34 @@ def complexity(node):
     tree hierarchy unless there is a Field node where we don't add up the
     complexity of the referenced relation. This way we treat fields kind of like
     reusable variables considering them less complex than they were inlined.
-    """
 
-    def accum(node, *args):
-        if isinstance(node, ops.Field):
-            return 1
-        elif isinstance(node, ops.Impure):
+    `scores` memoizes the scores of already visited nodes, pass the same
+    mapping to score several nodes sharing subtrees.
+    """
+    if scores is None:
+        scores = {}
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if current in scores:
+            stack.pop()
+        elif isinstance(current, ops.Field):
+            scores[current] = 1
+        elif isinstance(current, ops.Impure):
             # consider (potentially) impure functions maximally complex
-            return sys.maxsize
+            scores[current] = sys.maxsize
+        elif pending := [
+            child for child in current.__children__ if child not in scores
+        ]:
+            stack.extend(pending)
         else:
-            return 1 + sum(args)
+            scores[current] = 1 + sum(scores[child] for child in current.__children__)
 
-    return node.map_nodes(accum)[node]
+    return scores[node]
 
 
 @replace(Object(Select, Object(Select)))
-def merge_select_select(_, **kwargs):
+def merge_select_select(_, complexities, **kwargs):
     """Merge subsequent Select relations into one.
 
     This rewrites eliminates `_.parent` by merging the outer and the inner
@@ -329,7 +341,9 @@ def merge_select_select(_, **kwargs):
         ),
         distinct=distinct,
     )
-    return result if complexity(result) <= complexity(_) else _
+    if complexity(result, complexities) <= complexity(_, complexities):
+        return result
+    return _
 
 
 def extract_ctes(node: ops.Relation) -> set[ops.Relation]:
@@ -349,7 +363,7 @@ def extract_ctes(node: ops.Relation) -> set[ops.Relation]:
 
 def sqlize(
     node: ops.Node,
-    params: Mapping[ops.ScalarParameter, Any],
+    params: Mapping[ops.ScalarParameter, Any] | None,
     rewrites: Sequence[Pattern] = (),
     post_rewrites: Sequence[Pattern] = (),
     fuse_selects: bool = True,
@@ -361,7 +375,8 @@ def sqlize(
     node
         The root node of the expression graph.
     params
-        A mapping of scalar parameters to their values.
+        A mapping of scalar parameters to their values. If `None`, the
+        parameters are left unbound and compile to placeholders.
     rewrites
         Supplementary rewrites to apply before SQL-specific transforms.
     post_rewrites
@@ -376,15 +391,18 @@ def sqlize(
     """
     assert isinstance(node, ops.Relation)
 
+    # the backend specific rewrites, the lowering and the select merging only
+    # match on the node at hand, so they're applied as phases of a single
+    # traversal instead of traversing the whole graph once per phase
+    phases = []
+
     # apply the backend specific rewrites
     if rewrites:
-        node = node.replace(reduce(operator.or_, rewrites))
+        phases.append(reduce(operator.or_, rewrites))
 
     # lower the expression graph to a SQL-like relational algebra
-    context = {"params": params}
-    result = node.replace(
-        replace_parameter
-        | remove_aliases
+    lowering = (
+        remove_aliases
         | project_to_select
         | filter_to_select
         | sort_to_select
@@ -392,13 +410,20 @@ def sqlize(
         | fill_null_to_select
         | drop_null_to_select
         | drop_columns_to_select
-        | first_to_firstvalue,
-        context=context,
+        | first_to_firstvalue
     )
+    if params is not None:
+        lowering = replace_parameter | lowering
+    phases.append(lowering)
 
     # squash subsequent Select nodes into one
     if fuse_selects:
-        result = result.replace(merge_select_select)
+        phases.append(merge_select_select)
+
+    # `merge_select_select` scores every candidate Select and its whole parent
+    # chain, the scores are shared within this call to avoid quadratic work
+    context = {"params": params, "complexities": {}}
+    result = node.replace(phases, context=context)
 
     if post_rewrites:
         result = result.replace(reduce(operator.or_, post_rewrites))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 import sqlglot as sg
 
 import ibis
@@ -26,3 +27,31 @@ def test_transpile_join():
         "SELECT * FROM t1 JOIN t2 ON x = y", read="duckdb", write=Trino
     )
     assert "CROSS JOIN" not in result
+
+
+def test_visitors_are_resolved_per_compiler():
+    import ibis.expr.operations as ops
+    from ibis.backends.sql.compilers import DuckDBCompiler, PostgresCompiler
+
+    class CustomCompiler(DuckDBCompiler):
+        def visit_Abs(self, op, *, arg):
+            return sg.func("custom_abs", arg)
+
+    assert DuckDBCompiler.visitors[ops.Abs] is DuckDBCompiler.visit_Abs
+    assert CustomCompiler.visitors[ops.Abs] is CustomCompiler.visit_Abs
+    assert PostgresCompiler.visitors[ops.Add] is PostgresCompiler.visit_Add
+
+    @ibis.udf.scalar.builtin
+    def my_func(x: int) -> int: ...
+
+    t = ibis.table({"a": "int"}, name="t")
+    sql = CustomCompiler().to_sqlglot(t.select(x=t.a.abs(), y=my_func(t.a))).sql()
+    assert "CUSTOM_ABS" in sql.upper()
+    assert "MY_FUNC" in sql.upper()
+
+
+def test_unbound_scalar_parameter_raises():
+    t = ibis.table({"a": "int"}, name="t")
+    expr = t.filter(t.a > ibis.param("int"))
+    with pytest.raises(KeyError):
+        ibis.to_sql(expr)
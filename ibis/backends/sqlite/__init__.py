@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import sqlite3
+import weakref
 from typing import TYPE_CHECKING, Any
 
 import sqlglot as sg
@@ -17,13 +18,16 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import UrlFromPath
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import C
-from ibis.backends.sqlite.converter import SQLitePandasData
+from ibis.backends.sqlite.converter import (
+    SQLitePandasData,
+    SQLitePyArrowRowDecoder,
+)
 from ibis.backends.sqlite.udf import ignore_nulls, register_all
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from pathlib import Path
 
     import pandas as pd
@@ -47,6 +51,7 @@ class Backend(SQLBackend, UrlFromPath):
     name = "sqlite"
     compiler = sc.sqlite.compiler
     supports_python_udfs = True
+    _bind_paramstyle = "qmark"
 
     @property
     def current_database(self) -> str:
@@ -56,6 +61,7 @@ class Backend(SQLBackend, UrlFromPath):
     def version(self) -> str:
         return sqlite3.sqlite_version
 
+    @invalidates_metadata
     def do_connect(
         self,
         database: str | Path | None = None,
@@ -129,13 +135,30 @@ class Backend(SQLBackend, UrlFromPath):
         else:
             self._type_map = {}
 
+        # mapping of udf names to the udf classes registered on this
+        # connection, so that udfs are registered once instead of per query
+        self._registered_udfs = weakref.WeakValueDictionary()
+
         register_all(self.con)
         self.con.execute("PRAGMA case_sensitive_like=ON")
 
-    def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
+    def raw_sql(
+        self, query: str | sg.Expression, params: Sequence[Any] = (), **kwargs: Any
+    ) -> Any:
         if not isinstance(query, str):
             query = query.sql(dialect=self.name)
-        return self.con.execute(query, **kwargs)
+        return self.con.execute(query, params, **kwargs)
+
+    def _can_bind(self, dtype: dt.DataType) -> bool:
+        # temporal values are stored as strings whose format must match the
+        # compiled literals, and sqlite3 cannot adapt decimals
+        return (
+            dtype.is_boolean()
+            or dtype.is_integer()
+            or dtype.is_floating()
+            or dtype.is_string()
+            or dtype.is_binary()
+        )
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
@@ -161,6 +184,7 @@ class Backend(SQLBackend, UrlFromPath):
 
         return sorted(self._filter_with_like(results, like))
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
     ) -> list[str]:
@@ -268,6 +292,7 @@ class Backend(SQLBackend, UrlFromPath):
             }
         )
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -329,19 +354,18 @@ class Backend(SQLBackend, UrlFromPath):
         chunk_size: int = 1_000_000,
         **_: Any,
     ) -> pa.ipc.RecordBatchReader:
-        import pyarrow as pa
-
-        self._run_pre_execute_hooks(expr)
-
-        schema = expr.as_table().schema()
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
-            df = self._fetch_from_cursor(cursor, schema)
-        table = pa.Table.from_pandas(
-            df, schema=schema.to_pyarrow(), preserve_index=False
+        pa = self._import_pyarrow()
+
+        decoder = SQLitePyArrowRowDecoder(expr.as_table().schema())
+        # convert the rows as they are fetched so that at most `chunk_size`
+        # rows are held in memory at a time
+        batches = map(
+            decoder.decode,
+            self._cursor_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size
+            ),
         )
-        return table.to_reader(max_chunksize=chunk_size)
+        return pa.ipc.RecordBatchReader.from_batches(decoder.arrow_schema, batches)
 
     def _generate_create_table(self, table: sge.Table, schema: sch.Schema):
         target = sge.Schema(this=table, expressions=schema.to_sqlglot(self.dialect))
@@ -363,17 +387,24 @@ class Backend(SQLBackend, UrlFromPath):
             cur.executemany(insert_stmt, data)
 
     def _register_udfs(self, expr: ir.Expr) -> None:
-        import ibis.expr.operations as ops
-
         con = self.con
+        registered = self._registered_udfs
+
+        for udf_node in expr.op().__facts__.udfs:
+            udf_class = type(udf_node)
+            name = udf_class.__name__
+
+            # the connection already has this exact definition
+            if registered.get(name) is udf_class:
+                continue
 
-        for udf_node in expr.op().find(ops.ScalarUDF):
             compile_func = getattr(
                 self, f"_register_{udf_node.__input_type__.name.lower()}_udf"
             )
             registration_func = compile_func(udf_node)
             if registration_func is not None:
                 registration_func(con)
+                registered[name] = udf_class
 
     def _register_python_udf(self, udf_node: ops.ScalarUDF) -> None:
         name = type(udf_node).__name__
@@ -402,6 +433,7 @@ class Backend(SQLBackend, UrlFromPath):
 
         return register_udf
 
+    @invalidates_metadata
     def attach(self, name: str, path: str | Path) -> None:
         """Connect another SQLite database file to the current connection.
 
@@ -423,6 +455,7 @@ class Backend(SQLBackend, UrlFromPath):
         with self.begin() as cur:
             cur.execute(f"ATTACH DATABASE {str(path)!r} AS {_quote(name)}")
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -531,6 +564,7 @@ class Backend(SQLBackend, UrlFromPath):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    @invalidates_metadata
     def drop_table(
         self,
         name: str,
@@ -547,6 +581,7 @@ class Backend(SQLBackend, UrlFromPath):
         with self._safe_raw_sql(drop_stmt):
             pass
 
+    @invalidates_metadata
     def create_view(
         self,
         name: str,
@@ -4,6 +4,7 @@ import pandas as pd
 from packaging.version import parse as vparse
 
 from ibis.formats.pandas import PandasData
+from ibis.formats.pyarrow import PyArrowRowDecoder
 
 # The "mixed" format was added in pandas 2
 _DATETIME_FORMAT = "mixed" if vparse(pd.__version__) >= vparse("2.0.0") else None
@@ -22,3 +23,14 @@ class SQLitePandasData(PandasData):
         except ValueError:
             # Parsing failed, try a more relaxed parser
             return pd.to_datetime(s, format=_DATETIME_FORMAT, utc=True)
+
+
+class SQLitePyArrowRowDecoder(PyArrowRowDecoder):
+    """Decode SQLite rows, parsing the temporal values stored as text."""
+
+    __slots__ = ()
+
+    def _builder(self, dtype):
+        if dtype.is_temporal():
+            return self._pandas_builder(SQLitePandasData, dtype)
+        return super()._builder(dtype)
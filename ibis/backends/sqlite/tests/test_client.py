@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import os
 import sqlite3
+from datetime import date, datetime, time
 from pathlib import Path
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pytest import param
 
@@ -52,6 +55,36 @@ def test_builtin_agg_udf(con):
     assert result == 0.0
 
 
+def test_udfs_are_registered_once(mocker):
+    con = ibis.sqlite.connect()
+    spy = mocker.spy(con, "_register_python_udf")
+
+    @ibis.udf.scalar.python
+    def add_one(x: int) -> int:
+        return x + 1
+
+    assert con.execute(add_one(ibis.literal(1))) == 2
+    assert con.execute(add_one(ibis.literal(2))) == 3
+    assert spy.call_count == 1
+
+    # reconnecting starts over with a fresh connection
+    con.reconnect()
+    assert con.execute(add_one(ibis.literal(3))) == 4
+    assert spy.call_count == 2
+
+
+def test_dedup_memtables_uploads_once(monkeypatch, mocker):
+    monkeypatch.setattr(ibis.options, "dedup_memtables", True)
+    con = ibis.sqlite.connect()
+    spy = mocker.spy(con, "_register_in_memory_table")
+
+    for _ in range(2):
+        t = ibis.memtable({"a": [1, 2, 3]})
+        assert con.execute(t.a.sum()) == 6
+
+    assert spy.call_count == 1
+
+
 @pytest.mark.parametrize(
     "url, ext",
     [
@@ -96,3 +129,73 @@ def test_list_temp_tables_by_default(con):
     con.create_table(name, schema={"a": "int"}, temp=True)
     assert name in con.list_tables(database="temp")
     assert name in con.list_tables()
+
+
+def test_bind_params(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "bind_params", True)
+    con = ibis.sqlite.connect()
+
+    t = ibis.memtable({"a": [1, 2, 3], "s": ["x%", "y", "z"]})
+    value = ibis.param("int64")
+    label = ibis.param("string")
+    expr = t.filter(t.a > value, t.s.like("%")).mutate(b=value * 2, c=label)
+
+    sql, bound = con._compile_bound(expr, params={value: 1, label: "hi"})
+    assert "?" in sql
+    assert bound == {"params": [1, "hi", 1]}
+
+    result = con.execute(expr, params={value: 1, label: "hi"})
+    assert result.b.tolist() == [2, 2]
+    assert result.c.tolist() == ["hi", "hi"]
+
+    result = con.to_pyarrow(expr, params={value: 2, label: "hi"})
+    assert result["b"].to_pylist() == [4]
+
+
+def test_to_pyarrow_batches_streams():
+    con = ibis.sqlite.connect()
+    t = ibis.memtable(
+        {
+            "a": list(range(10)),
+            "ts": pd.date_range("2020-01-01", periods=10, freq="D"),
+        }
+    )
+
+    with con.to_pyarrow_batches(t.order_by("a"), chunk_size=3) as reader:
+        batches = list(reader)
+
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+    assert all(batch.schema == t.schema().to_pyarrow() for batch in batches)
+    assert pa.Table.from_batches(batches)["a"].to_pylist() == list(range(10))
+
+
+def test_to_pyarrow_batches_parses_text_values():
+    con = ibis.sqlite.connect()
+    con.raw_sql("CREATE TABLE t (ts TIMESTAMP, d DATE, tm TIME, b BOOLEAN)")
+    con.raw_sql(
+        """
+        INSERT INTO t VALUES
+        ('2024-01-02 03:04:05', '2024-01-02', '03:04:05', 1),
+        ('2024-01-02T03:04:05.5Z', NULL, NULL, 0)
+        """
+    )
+    t = con.table("t")
+
+    with con.to_pyarrow_batches(t, chunk_size=1) as reader:
+        result = reader.read_all()
+
+    assert result.schema == t.schema().to_pyarrow()
+    assert result.to_pylist() == [
+        {
+            "ts": datetime(2024, 1, 2, 3, 4, 5),
+            "d": date(2024, 1, 2),
+            "tm": time(3, 4, 5),
+            "b": True,
+        },
+        {
+            "ts": datetime(2024, 1, 2, 3, 4, 5, 500000),
+            "d": None,
+            "tm": None,
+            "b": False,
+        },
+    ]
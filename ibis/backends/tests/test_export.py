@@ -57,6 +57,30 @@ def test_table___arrow_c_stream__(awards_players):
     assert len(res) == len(sol)
 
 
+@pytest.mark.skipif(
+    vparse(pa.__version__) < vparse("14"), reason="pyarrow >= 14 required"
+)
+def test_table___arrow_c_stream___streams(monkeypatch, awards_players):
+    def to_pyarrow(*_, **__):
+        raise AssertionError("table should not be materialized")
+
+    monkeypatch.setattr(type(awards_players), "to_pyarrow", to_pyarrow)
+
+    reader = pa.RecordBatchReader.from_stream(awards_players)
+    assert reader.schema.equals(awards_players.schema().to_pyarrow())
+    assert sum(map(len, reader)) == awards_players.count().execute()
+
+
+@pytest.mark.skipif(
+    vparse(pa.__version__) < vparse("16"), reason="pyarrow >= 16 required"
+)
+def test_column___arrow_c_stream__(awards_players):
+    sol = awards_players.awardID.to_pyarrow()
+    res = pa.chunked_array(awards_players.awardID)
+    assert res.type.equals(sol.type)
+    assert res.to_pylist() == sol.to_pylist()
+
+
 @pytest.mark.parametrize("limit", limit_no_limit)
 def test_table_to_pyarrow_batches(limit, awards_players):
     with awards_players.to_pyarrow_batches(limit=limit) as batch_reader:
@@ -248,6 +272,16 @@ def test_table_to_parquet_dir(tmp_path, backend, awards_players):
     backend.assert_frame_equal(result, expected)
 
 
+@pytest.mark.notimpl(["pyspark"], reason="writes with spark's own partitioning")
+def test_table_to_parquet_dir_partition_by(tmp_path, backend, awards_players):
+    outparquet_dir = tmp_path / "out"
+    awards_players.to_parquet_dir(outparquet_dir, partition_by="lgID")
+
+    partitions = {path.name for path in outparquet_dir.iterdir()}
+    expected = {f"lgID={lg}" for lg in awards_players.lgID.to_pandas().unique()}
+    assert partitions == expected
+
+
 @pytest.mark.notimpl(
     ["duckdb"],
     reason="cannot inline WriteOptions objects",
@@ -21,25 +21,47 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanCreateDatabase, CanListCatalog
-from ibis.backends.sql import SQLBackend
+from ibis.backends.sql import SQLBackend, cached_metadata, invalidates_metadata
 from ibis.backends.sql.compilers.base import AlterTable, C, RenameTable
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from urllib.parse import ParseResult
 
     import pandas as pd
     import polars as pl
     import pyarrow as pa
 
+    import ibis.expr.datatypes as dt
     import ibis.expr.operations as ops
 
+# Trino rejects statements longer than `query.max-length`, which defaults to
+# 1,000,000 characters
+_MEMTABLE_INSERT_MAX_BYTES = 512 * 1024
+
+# number of memtable rows rendered to SQL at a time
+_MEMTABLE_RENDER_CHUNK_ROWS = 1024
+
+
+def _from_pylist(dtype: dt.DataType, value: Any) -> Any:
+    """Convert a value from `pa.Array.to_pylist` into a literal value."""
+    if value is None:
+        return None
+    elif dtype.is_map():
+        return {k: _from_pylist(dtype.value_type, v) for k, v in value}
+    elif dtype.is_array():
+        return [_from_pylist(dtype.value_type, v) for v in value]
+    elif dtype.is_struct():
+        return {k: _from_pylist(t, value[k]) for k, t in dtype.items()}
+    return value
+
 
 class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
     name = "trino"
     compiler = sc.trino.compiler
     supports_create_or_replace = False
     supports_temporary_tables = False
+    _bind_paramstyle = "qmark"
 
     def _from_url(self, url: ParseResult, **kwargs):
         catalog, db = url.path.strip("/").split("/")
@@ -54,15 +76,27 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         )
         return self
 
-    def raw_sql(self, query: str | sg.Expression) -> Any:
-        """Execute a raw SQL query."""
+    def raw_sql(
+        self, query: str | sg.Expression, params: Sequence[Any] | None = None
+    ) -> Any:
+        """Execute a raw SQL query.
+
+        Parameters
+        ----------
+        query
+            The query to execute.
+        params
+            Values of the `?` placeholders in `query`, executed as a prepared
+            statement.
+
+        """
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name, pretty=True)
 
         con = self.con
         cur = con.cursor()
         try:
-            cur.execute(query)
+            cur.execute(query, params)
         except Exception:
             if con.transaction is not None:
                 con.rollback()
@@ -93,7 +127,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
     @contextlib.contextmanager
     def _safe_raw_sql(
-        self, query: str | sge.Expression
+        self, query: str | sge.Expression, params: Sequence[Any] | None = None
     ) -> Iterator[trino.dbapi.Cursor]:
         """Execute a raw SQL query, yielding the cursor.
 
@@ -101,6 +135,8 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         ----------
         query
             The query to execute.
+        params
+            Values of the `?` placeholders in `query`.
 
         Yields
         ------
@@ -108,13 +144,14 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             The cursor of the executed query.
 
         """
-        cur = self.raw_sql(query)
+        cur = self.raw_sql(query, params)
         try:
             yield cur
         finally:
             if cur._query:
                 cur.close()
 
+    @cached_metadata
     def get_schema(
         self,
         table_name: str,
@@ -209,6 +246,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             databases = cur.fetchall()
         return self._filter_with_like(list(map(itemgetter(0), databases)), like)
 
+    @cached_metadata
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
     ) -> list[str]:
@@ -241,6 +279,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
         return self._filter_with_like(list(map(itemgetter(0), tables)), like=like)
 
+    @invalidates_metadata
     def do_connect(
         self,
         user: str = "user",
@@ -366,6 +405,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             }
         )
 
+    @invalidates_metadata
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -378,6 +418,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         ):
             pass
 
+    @invalidates_metadata
     def drop_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -390,6 +431,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         ):
             pass
 
+    @invalidates_metadata
     def create_table(
         self,
         name: str,
@@ -565,9 +607,59 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             ),
         ).sql(self.name)
 
-        data = op.data.to_frame().itertuples(index=False)
-        insert_stmt = self._build_insert_template(name, schema=schema)
         with self.begin() as cur:
             cur.execute(create_stmt)
-            for row in data:
-                cur.execute(insert_stmt, row)
+            # statements run one after the other on the backend's connection,
+            # which can't be shared between threads
+            for stmt in self._insert_values_batches(name, op):
+                cur.execute(stmt)
+
+    def _insert_values_batches(
+        self, name: str, op: ops.InMemoryTable, *, max_bytes: int | None = None
+    ) -> Iterator[str]:
+        """Render the rows of `op` as multi-row `INSERT ... VALUES` statements.
+
+        Each statement is at most `max_bytes` long, unless a single row is
+        larger than that on its own.
+        """
+        import ibis.expr.operations as ops
+
+        if max_bytes is None:
+            max_bytes = _MEMTABLE_INSERT_MAX_BYTES
+
+        schema = op.schema
+        compiler = self.compiler
+        dialect = compiler.dialect
+        table = sg.table(name, quoted=compiler.quoted).sql(dialect)
+        prefix = f"INSERT INTO {table} VALUES "  # noqa: S608
+
+        def to_sql(value: Any, dtype: dt.DataType) -> str:
+            lit = ops.Literal(_from_pylist(dtype, value), dtype)
+            return compiler.visit_Literal(lit, value=lit.value, dtype=dtype).sql(
+                dialect
+            )
+
+        def render_rows() -> Iterator[str]:
+            # render a chunk of rows at a time, so that a statement is sent
+            # before the rows that follow it are rendered
+            data = op.data.to_pyarrow(schema)
+            for batch in data.to_batches(max_chunksize=_MEMTABLE_RENDER_CHUNK_ROWS):
+                columns = [
+                    [to_sql(value, dtype) for value in column.to_pylist()]
+                    for column, dtype in zip(batch.columns, schema.types)
+                ]
+                for values in zip(*columns):
+                    yield f"({', '.join(values)})"
+
+        rows = []
+        nbytes = len(prefix)
+        for row in render_rows():
+            size = len(row.encode()) + 2
+            if rows and nbytes + size > max_bytes:
+                yield prefix + ", ".join(rows)
+                rows.clear()
+                nbytes = len(prefix)
+            rows.append(row)
+            nbytes += size
+        if rows:
+            yield prefix + ", ".join(rows)
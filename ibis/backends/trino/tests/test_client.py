@@ -198,3 +198,39 @@ def test_connect_uri():
 
     assert result.iat[0, 0] == 1
     assert result.iat[0, 1] == "b"
+
+
+def test_memtable_upload_batches(con, mocker):
+    n = 5_000
+    t = ibis.memtable(
+        {"a": range(n), "b": [None if i % 7 == 0 else str(i) for i in range(n)]}
+    )
+    spy = mocker.spy(con, "_insert_values_batches")
+
+    result = con.to_pandas(t.order_by("a"))
+
+    assert spy.call_count == 1
+    assert len(result) == n
+    assert result.a.tolist() == list(range(n))
+    assert result.b.isnull().sum() == len(range(0, n, 7))
+
+
+def test_insert_values_batches_max_bytes(con):
+    t = ibis.memtable({"a": range(1_000)})
+    stmts = list(con._insert_values_batches("t", t.op(), max_bytes=1_024))
+
+    assert len(stmts) > 1
+    assert all(len(stmt.encode()) <= 1_024 for stmt in stmts)
+    assert sum(stmt.count("(") for stmt in stmts) == 1_000
+
+
+def test_insert_values_batches_render_lazily(con, mocker):
+    t = ibis.memtable({"a": range(10_000)})
+    stmts = con._insert_values_batches("t", t.op(), max_bytes=1_024)
+    spy = mocker.spy(con.compiler, "visit_Literal")
+
+    next(stmts)
+    assert spy.call_count < 10_000
+
+    list(stmts)
+    assert spy.call_count == 10_000
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections.abc
+import weakref
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 from weakref import WeakValueDictionary
@@ -134,18 +135,31 @@ class Comparable(Abstract):
 
     The subclasses must implement the `__equals__` method that returns a boolean
     value indicating whether the two instances are equal. This method is called
-    only if the two instances are of the same type and the result is cached for
-    future comparisons.
+    only if the two instances are of the same type.
 
-    Since the class holds a global cache of comparison results, it is important
-    to make sure that the instances are not kept alive longer than necessary.
+    Instances found to be equal are merged into the same equivalence class,
+    where every instance holds a weak reference towards a representative of
+    the class. Subsequent comparisons between any members of the class reduce
+    to an identity check of their representatives, without any global state
+    keeping track of the instances.
     """
 
-    __cache__ = {}
+    __slots__ = ("__equivalent__",)
 
     @abstractmethod
     def __equals__(self, other) -> bool: ...
 
+    def __representative__(self) -> Self:
+        node = self
+        while (ref := getattr(node, "__equivalent__", None)) is not None:
+            if (parent := ref()) is None:
+                break
+            node = parent
+        if node is not self and self.__equivalent__() is not node:
+            # point directly to the representative to keep the chains short
+            object.__setattr__(self, "__equivalent__", weakref.ref(node))
+        return node
+
     def __eq__(self, other) -> bool:
         if self is other:
             return True
@@ -154,23 +168,23 @@ class Comparable(Abstract):
         if type(self) is not type(other):
             return False
 
-        id1 = id(self)
-        id2 = id(other)
-        try:
-            return self.__cache__[id1][id2]
-        except KeyError:
-            result = self.__equals__(other)
-            self.__cache__.setdefault(id1, {})[id2] = result
-            self.__cache__.setdefault(id2, {})[id1] = result
-            return result
-
-    def __del__(self):
-        id1 = id(self)
-        for id2 in self.__cache__.pop(id1, ()):
-            eqs2 = self.__cache__[id2]
-            del eqs2[id1]
-            if not eqs2:
-                del self.__cache__[id2]
+        # most instances were never merged, avoid resolving them
+        if getattr(self, "__equivalent__", None) is None:
+            this = self
+        else:
+            this = self.__representative__()
+        if getattr(other, "__equivalent__", None) is None:
+            that = other
+        else:
+            that = other.__representative__()
+
+        if this is that:
+            return True
+        elif self.__equals__(other):
+            object.__setattr__(that, "__equivalent__", weakref.ref(this))
+            return True
+        else:
+            return False
 
 
 class SlottedMeta(AbstractMeta):
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import functools
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
 
 
 def memoize(func: Callable) -> Callable:
@@ -22,3 +25,120 @@ def memoize(func: Callable) -> Callable:
             return result
 
     return wrapper
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a bounded cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A bounded mapping evicting the least recently used entries.
+
+    Lookups and insertions are guarded by a lock so a single instance can be
+    shared between threads.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of entries to keep. A value of zero disables caching.
+    ttl
+        Number of seconds after which an entry expires, [](`None`) means
+        entries never expire.
+    """
+
+    __slots__ = (
+        "_data",
+        "_evictions",
+        "_hits",
+        "_lock",
+        "_maxsize",
+        "_misses",
+        "_ttl",
+    )
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._hits = self._misses = self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    @property
+    def ttl(self) -> float | None:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float | None) -> None:
+        with self._lock:
+            self._ttl = value
+
+    def _evict(self) -> None:
+        data = self._data
+        while len(data) > self._maxsize:
+            data.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value, created = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if self._ttl is not None and time.monotonic() - created >= self._ttl:
+                del self._data[key]
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value, time.monotonic()
+            self._data.move_to_end(key)
+            self._evict()
+
+    def invalidate(self) -> None:
+        """Remove every entry, keeping the statistics."""
+        with self._lock:
+            self._data.clear()
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and eviction statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
@@ -23,7 +23,7 @@ Finder = Callable[["Node"], bool]
 FinderLike = Union[Finder, Pattern, _ClassInfo]
 
 Replacer = Callable[["Node", dict["Node", Any] | None], "Node"]
-ReplacerLike = Union[Replacer, Pattern, Mapping]
+ReplacerLike = Union[Replacer, Pattern, Mapping, Sequence["ReplacerLike"]]
 
 
 def _flatten_collections(node: Any) -> Iterator[N]:
@@ -206,7 +206,8 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
     Parameters
     ----------
     obj
-        A Pattern, Mapping, or Callable.
+        A Pattern, Mapping, Callable, or a list or tuple of these to apply as
+        ordered phases.
     context
         Optional context to use if the replacer is a pattern.
 
@@ -215,7 +216,18 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
     A callable replacer function which can be used to replace nodes.
 
     """
-    if isinstance(obj, Pattern):
+    if isinstance(obj, (list, tuple)):
+        first, *rest = (_coerce_replacer(phase, context) for phase in obj)
+
+        def fn(node, kwargs):
+            # the first phase receives the rewritten children, the subsequent
+            # phases receive the result of the previous phase as is
+            result = first(node, kwargs)
+            for phase in rest:
+                result = phase(result, None)
+            return result
+
+    elif isinstance(obj, Pattern):
 
         def fn(node, kwargs):
             ctx = context or {}
@@ -494,6 +506,12 @@ class Node(Hashable):
             A `Pattern`, `Mapping` or Callable taking the original unrewritten
             node, and a mapping of attribute name to value of its rewritten
             children (or None if no children were rewritten).
+
+            A list or tuple of replacers is applied as ordered phases during a
+            single traversal: every node is passed through all the phases
+            before its parents are visited. This is equivalent to applying the
+            replacers one after the other as long as the later phases don't
+            change anything that the earlier phases match on.
         filter
             A type, tuple of types, a pattern or a callable to filter out nodes
             from the traversal. The traversal will only visit nodes that match
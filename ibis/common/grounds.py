@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Callable, Iterator, MutableMapping  # noqa: TC003
 from copy import copy
 from typing import (
     Any,
@@ -8,10 +9,16 @@ from typing import (
     Union,
     get_origin,
 )
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self, dataclass_transform
 
 from ibis.common.annotations import (
+    EMPTY,
+    KEYWORD_ONLY,
+    POSITIONAL_ONLY,
+    VAR_KEYWORD,
+    VAR_POSITIONAL,
     Annotation,
     Argument,
     Attribute,
@@ -27,8 +34,184 @@ from ibis.common.bases import (  # noqa: F401
     Singleton,
 )
 from ibis.common.collections import FrozenDict  # noqa: TC001
-from ibis.common.patterns import Pattern
-from ibis.common.typing import evaluate_annotations
+from ibis.common.patterns import Any as AnyPattern
+from ibis.common.patterns import (
+    GenericCoercedTo,
+    GenericInstanceOf,
+    InstanceOf,
+    NoMatch,
+    Option,
+    Pattern,
+)
+from ibis.common.typing import CoercionError, evaluate_annotations
+
+
+class _CodeGen:
+    """Source code builder for the generated constructors.
+
+    The referenced objects are stored in the namespace the code is executed
+    in, the source only refers to them by their generated names.
+    """
+
+    __slots__ = ("lines", "namespace")
+
+    def __init__(self):
+        self.lines = []
+        self.namespace = {"NoMatch": NoMatch, "CoercionError": CoercionError}
+
+    def ref(self, obj: Any) -> str:
+        name = f"__{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def check(self, pattern: Pattern, value: str) -> str | None:
+        """Return an expression testing `value` if `pattern` is a pure check."""
+        if type(pattern) is AnyPattern:
+            return "True"
+        elif type(pattern) is InstanceOf:
+            return f"isinstance({value}, {self.ref(pattern.type)})"
+        elif type(pattern) is GenericInstanceOf:
+            checks = [f"isinstance({value}, {self.ref(pattern.origin)})"]
+            for attr, field in pattern.fields.items():
+                attr = f"{value}.{attr}"
+                if (check := self.check(field, attr)) is None:
+                    match = self.ref(field.match)
+                    check = f"{match}({attr}, __this) is not NoMatch"
+                if check != "True":
+                    checks.append(check)
+            return " and ".join(checks)
+        else:
+            return None
+
+    def match(self, indent: int, pattern: Pattern, name: str) -> None:
+        """Emit the statements matching and storing the argument `name`."""
+        if type(pattern) is Option:
+            self.emit(indent, f"if {name} is None:")
+            self.emit(indent + 1, f"__this[{name!r}] = {self.ref(pattern.default)}")
+            self.emit(indent, "else:")
+            self.match(indent + 1, pattern.pattern, name)
+            return
+
+        if (check := self.check(pattern, name)) is not None:
+            if check != "True":
+                self.emit(indent, f"if not ({check}):")
+                self.emit(indent + 1, "return None")
+        elif type(pattern) is GenericCoercedTo:
+            # inline the coercion so the checker can be inlined as well
+            coerce = self.ref(pattern.origin.__coerce__)
+            params = "".join(f", {k}={self.ref(v)}" for k, v in pattern.params.items())
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"{name} = {coerce}({name}{params})")
+            self.emit(indent, "except CoercionError:")
+            self.emit(indent + 1, "return None")
+            self.emit(indent, f"if not ({self.check(pattern.checker, name)}):")
+            self.emit(indent + 1, "return None")
+        else:
+            self.emit(indent, f"{name} = {self.ref(pattern.match)}({name}, __this)")
+            self.emit(indent, f"if {name} is NoMatch:")
+            self.emit(indent + 1, "return None")
+        self.emit(indent, f"__this[{name!r}] = {name}")
+
+    def compile(self, name: str, qualname: str) -> Callable:
+        source = "\n".join(self.lines)
+        code = compile(source, f"<generated {qualname}>", "exec")
+        exec(code, self.namespace)  # noqa: S102
+        func = self.namespace[name]
+        func.__qualname__ = qualname
+        return func
+
+
+def _compile_validators(cls: type[Annotable]) -> tuple[Callable, Callable]:
+    """Generate the argument validators specialized to the signature of `cls`.
+
+    The first validator binds positional and keyword arguments like a call to
+    the signature would, the second one expects keyword arguments only. Both
+    return the validated arguments or None if any of them fails to match, in
+    which case the generic validation is used to construct the error.
+    """
+    params = cls.__signature__.parameters.values()
+
+    header, slash, star = [], False, False
+    bind, nobind = _CodeGen(), _CodeGen()
+    for param in params:
+        name, kind = param.name, param.kind
+        if kind is not POSITIONAL_ONLY and not slash:
+            slash = True
+            if header:
+                header.append("/")
+        if kind is VAR_POSITIONAL:
+            star = True
+            header.append(f"*{name}")
+        elif kind is VAR_KEYWORD:
+            header.append(f"**{name}")
+        else:
+            if kind is KEYWORD_ONLY and not star:
+                star = True
+                header.append("*")
+            if param.default is EMPTY:
+                header.append(name)
+            else:
+                header.append(f"{name}={bind.ref(param.default)}")
+
+        if param.default is EMPTY:
+            nobind.emit(1, f"{name} = __kwargs.get({name!r}, NoMatch)")
+            nobind.emit(1, f"if {name} is NoMatch:")
+            nobind.emit(2, "return None")
+        else:
+            nobind.emit(
+                1, f"{name} = __kwargs.get({name!r}, {nobind.ref(param.default)})"
+            )
+
+    if header and not slash:
+        header.append("/")
+
+    bind.emit(0, f"def validate({', '.join(header)}):")
+    nobind.lines.insert(0, "def validate_nobind(__kwargs):")
+    for gen in (bind, nobind):
+        gen.emit(1, "__this = {}")
+        for param in params:
+            gen.match(1, param.annotation.pattern, param.name)
+        gen.emit(1, "return __this")
+
+    return (
+        bind.compile("validate", f"{cls.__qualname__}.__validate__"),
+        nobind.compile("validate_nobind", f"{cls.__qualname__}.__validate_nobind__"),
+    )
+
+
+def _compile_init(cls: type[Concrete]) -> Callable:
+    """Generate an `__init__` method specialized to the arguments of `cls`.
+
+    Equivalent to `Concrete.__init__` but with the argument and attribute
+    assignments unrolled. Instances of subclasses are passed to the generic
+    implementation since they may have additional arguments.
+    """
+    gen = _CodeGen()
+    setter = gen.ref(object.__setattr__)
+    klass = gen.ref(cls)
+    argnames = cls.__argnames__
+
+    gen.emit(0, f"def __init__(self, {''.join(f'{n}, ' for n in argnames)}**__kwargs):")
+    gen.emit(1, f"if self.__class__ is not {klass}:")
+    kwargs = "".join(f"{n}={n}, " for n in argnames)
+    gen.emit(2, f"return {gen.ref(Concrete.__init__)}(self, {kwargs}**__kwargs)")
+    for name in argnames:
+        gen.emit(1, f"{setter}(self, {name!r}, {name})")
+    gen.emit(1, f"__args = ({''.join(f'{n}, ' for n in argnames)})")
+    gen.emit(1, f"{setter}(self, '__args__', __args)")
+    gen.emit(1, f"{setter}(self, '__precomputed_hash__', hash(({klass}, __args)))")
+    gen.emit(1, f"{setter}(self, '__equivalent__', None)")
+    for name, field in cls.__attributes__.items():
+        if field.has_default():
+            default = gen.ref(field.get_default)
+            gen.emit(1, f"{setter}(self, {name!r}, {default}({name!r}, self))")
+
+    init = gen.compile("__init__", f"{cls.__qualname__}.__init__")
+    init.__wrapped__ = Concrete.__init__
+    return init
 
 
 class AnnotableMeta(AbstractMeta):
@@ -89,6 +272,7 @@ class AnnotableMeta(AbstractMeta):
             __match_args__=argnames,
             __signature__=signature,
             __slots__=tuple(slots),
+            __validators__=None,
         )
         return super().__new__(metacls, clsname, bases, namespace, **kwargs)
 
@@ -113,16 +297,43 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
     __match_args__: ClassVar[tuple[str, ...]]
     """Names of the arguments to be used for pattern matching."""
 
+    __validators__: ClassVar[tuple[Callable, Callable] | None]
+    """Generated validators of the class, compiled on first instantiation."""
+
+    @classmethod
+    def __compile__(cls) -> tuple[Callable, Callable]:
+        validators = cls.__validators__ = _compile_validators(cls)
+        return validators
+
+    @classmethod
+    def __validate__(cls, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict:
+        validate, _ = cls.__validators__ or cls.__compile__()
+        try:
+            this = validate(*args, **kwargs)
+        except TypeError:
+            this = None
+        if this is None:
+            # the generic validation binds the arguments again to report errors
+            this = cls.__signature__.validate(cls, args, kwargs)
+        return this
+
+    @classmethod
+    def __validate_nobind__(cls, kwargs: dict[str, Any]) -> dict:
+        _, validate_nobind = cls.__validators__ or cls.__compile__()
+        if (this := validate_nobind(kwargs)) is None:
+            this = cls.__signature__.validate_nobind(cls, kwargs)
+        return this
+
     @classmethod
     def __create__(cls, *args: Any, **kwargs: Any) -> Self:
         # construct the instance by passing only validated keyword arguments
-        kwargs = cls.__signature__.validate(cls, args, kwargs)
+        kwargs = cls.__validate__(args, kwargs)
         return super().__create__(**kwargs)
 
     @classmethod
     def __recreate__(cls, kwargs: Any) -> Self:
         # bypass signature binding by requiring keyword arguments only
-        kwargs = cls.__signature__.validate_nobind(cls, kwargs)
+        kwargs = cls.__validate_nobind__(kwargs)
         return super().__create__(**kwargs)
 
     def __init__(self, **kwargs: Any) -> None:
@@ -190,6 +401,45 @@ class Concrete(Immutable, Comparable, Annotable):
 
     __slots__ = ("__args__", "__precomputed_hash__")
 
+    __interned__: ClassVar[MutableMapping[Any, Self] | None] = None
+    """Table of the live instances if interning is enabled, see `interning`."""
+
+    @classmethod
+    def __compile__(cls) -> tuple[Callable, Callable]:
+        # specialize the constructor unless a custom one is defined
+        if "__init__" not in cls.__dict__ and _is_default_init(cls.__init__):
+            cls.__init__ = _compile_init(cls)
+        return super().__compile__()
+
+    @classmethod
+    def __create__(cls, *args: Any, **kwargs: Any) -> Self:
+        if cls.__interned__ is None:
+            return super().__create__(*args, **kwargs)
+        kwargs = cls.__validate__(args, kwargs)
+        return cls.__intern__(kwargs)
+
+    @classmethod
+    def __recreate__(cls, kwargs: Any) -> Self:
+        if cls.__interned__ is None:
+            return super().__recreate__(kwargs)
+        kwargs = cls.__validate_nobind__(kwargs)
+        return cls.__intern__(kwargs)
+
+    @classmethod
+    def __intern__(cls, kwargs: dict[str, Any]) -> Self:
+        # the arguments are interned already, so the key comparison is cheap
+        table = cls.__interned__
+        if _is_default_init(cls.__init__):
+            key = (cls, tuple(kwargs[name] for name in cls.__argnames__))
+            if (instance := table.get(key)) is None:
+                instance = table[key] = super(Annotable, cls).__create__(**kwargs)
+            return instance
+        else:
+            # custom constructors may normalize the arguments, so the instance
+            # must be constructed to compute its key
+            instance = super(Annotable, cls).__create__(**kwargs)
+            return table.setdefault((cls, instance.__args__), instance)
+
     def __init__(self, **kwargs: Any) -> None:
         # collect and set the arguments in a single pass
         args = []
@@ -203,6 +453,7 @@ class Concrete(Immutable, Comparable, Annotable):
         hashvalue = hash((self.__class__, args))
         object.__setattr__(self, "__args__", args)
         object.__setattr__(self, "__precomputed_hash__", hashvalue)
+        object.__setattr__(self, "__equivalent__", None)
 
         # initialize the remaining attributes
         for name, field in self.__attributes__.items():
@@ -219,7 +470,10 @@ class Concrete(Immutable, Comparable, Annotable):
         return self.__precomputed_hash__
 
     def __equals__(self, other) -> bool:
-        return hash(self) == hash(other) and self.__args__ == other.__args__
+        return (
+            self.__precomputed_hash__ == other.__precomputed_hash__
+            and self.__args__ == other.__args__
+        )
 
     @property
     def args(self):
@@ -235,3 +489,39 @@ class Concrete(Immutable, Comparable, Annotable):
             raise AttributeError(f"Unexpected arguments: {unknown_args}")
         kwargs.update(overrides)
         return self.__recreate__(kwargs)
+
+
+def _is_default_init(init: Callable) -> bool:
+    # generated constructors are marked as wrapping the generic one
+    return init is Concrete.__init__ or (
+        getattr(init, "__wrapped__", None) is Concrete.__init__
+    )
+
+
+@contextlib.contextmanager
+def interning(cls: type[Concrete] = Concrete) -> Iterator[MutableMapping]:
+    """Share the structurally equal instances of `cls` and its subclasses.
+
+    While the context is active, constructing an instance equal to a live one
+    returns the existing instance instead of allocating a new one, so equal
+    nodes are compared by identity. The instances are held weakly.
+
+    Parameters
+    ----------
+    cls
+        The class whose instances and subclass instances are interned.
+
+    Yields
+    ------
+    MutableMapping
+        The table of interned instances.
+    """
+    previous = cls.__dict__.get("__interned__")
+    table = cls.__interned__ = WeakValueDictionary()
+    try:
+        yield table
+    finally:
+        if previous is None:
+            del cls.__interned__
+        else:
+            cls.__interned__ = previous
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import gc
 import pickle
 import weakref
 from abc import ABCMeta, abstractmethod
@@ -78,19 +79,7 @@ def test_immutable():
     assert copy.deepcopy(foo) is foo
 
 
-class Cache(dict):
-    def setpair(self, a, b, value):
-        a, b = id(a), id(b)
-        self.setdefault(a, {})[b] = value
-        self.setdefault(b, {})[a] = value
-
-    def getpair(self, a, b):
-        return self.get(id(a), {}).get(id(b))
-
-
 class Node(Comparable):
-    # override the default cache object
-    __cache__ = Cache()
     __slots__ = ("name",)
     num_equal_calls = 0
 
@@ -109,107 +98,79 @@ class Node(Comparable):
 
 
 @pytest.fixture
-def cache():
+def calls():
     Node.num_equal_calls = 0
-    cache = Node.__cache__
-    yield cache
-    assert not cache
+    yield
 
 
-def test_comparable_basic(cache):
+def test_comparable_basic(calls):
     a = Node(name="a")
     b = Node(name="a")
     c = Node(name="a")
+    d = Node(name="d")
     assert a == b
     assert a == c
-    del a
-    del b
-    del c
+    assert a != d
+    assert d != a
 
 
-def test_comparable_caching(cache):
+def test_comparable_caching(calls):
     a = Node(name="a")
-    b = Node(name="b")
-    c = Node(name="c")
+    b = Node(name="a")
+    c = Node(name="a")
     d = Node(name="d")
-    e = Node(name="e")
-
-    cache.setpair(a, b, True)
-    cache.setpair(a, c, False)
-    cache.setpair(c, d, True)
-    cache.setpair(b, d, False)
-    expected = {
-        id(a): {id(b): True, id(c): False},
-        id(b): {id(a): True, id(d): False},
-        id(c): {id(a): False, id(d): True},
-        id(d): {id(c): True, id(b): False},
-    }
-    assert cache == expected
 
     assert a == b
-    assert b == a
-    assert a != c
-    assert c != a
-    assert c == d
-    assert d == c
-    assert b != d
-    assert d != b
-    assert Node.num_equal_calls == 0
-    assert cache == expected
-
-    # no cache hit
-    assert cache.getpair(a, e) is None
-    assert a != e
-    assert cache.getpair(a, e) is False
-    assert Node.num_equal_calls == 1
-    expected = {
-        id(a): {id(b): True, id(c): False, id(e): False},
-        id(b): {id(a): True, id(d): False},
-        id(c): {id(a): False, id(d): True},
-        id(d): {id(c): True, id(b): False},
-        id(e): {id(a): False},
-    }
-    assert cache == expected
-
-    # run only once
-    assert e != a
     assert Node.num_equal_calls == 1
-    assert cache.getpair(a, e) is False
-    assert cache == expected
+    assert a.__representative__() is b.__representative__()
 
+    # cache hit in both directions
+    assert a == b
+    assert b == a
+    assert Node.num_equal_calls == 1
 
-def test_comparable_garbage_collection(cache):
-    a = Node(name="a")
-    b = Node(name="b")
-    c = Node(name="c")
-    d = Node(name="d")
-
-    cache.setpair(a, b, True)
-    cache.setpair(a, c, False)
-    cache.setpair(c, d, True)
-    cache.setpair(b, d, False)
-
-    assert cache.getpair(a, c) is False
-    assert cache.getpair(c, d) is True
-    del c
-    assert cache == {
-        id(a): {id(b): True},
-        id(b): {id(a): True, id(d): False},
-        id(d): {id(b): False},
-    }
-
-    assert cache.getpair(a, b) is True
-    assert cache.getpair(b, d) is False
-    del b
-    assert cache == {}
+    # equality is transitive through the representatives
+    assert c == a
+    assert Node.num_equal_calls == 2
+    assert b == c
+    assert c == b
+    assert Node.num_equal_calls == 2
 
+    # inequality is not cached
     assert a != d
-    assert cache == {id(a): {id(d): False}, id(d): {id(a): False}}
-    del a
-    assert cache == {}
+    assert d != a
+    assert Node.num_equal_calls == 4
 
 
-def test_comparable_cache_reuse(cache):
+def test_comparable_garbage_collection(calls):
+    a = Node(name="a")
+    b = Node(name="a")
+    c = Node(name="a")
+
+    assert a == b
+    assert b == c
+    rep = a.__representative__()
+    assert b.__representative__() is rep
+    assert c.__representative__() is rep
+
+    # no strong references are kept to the other members of the class
+    ref = weakref.ref(rep)
+    others = [node for node in (a, b, c) if node is not rep]
+    del a, b, c, rep
+    gc.collect()
+    assert ref() is None
+
+    # the remaining members recompute their equality once
+    x, y = others
+    assert x.__representative__() is x
+    assert y.__representative__() is y
+    before = Node.num_equal_calls
+    assert x == y
+    assert y == x
+    assert Node.num_equal_calls == before + 1
+
+
+def test_comparable_cache_reuse(calls):
     nodes = [
         Node(name="a"),
         Node(name="b"),
@@ -217,25 +178,19 @@ def test_comparable_cache_reuse(cache):
         Node(name="d"),
         Node(name="e"),
     ]
-
-    expected = 0
-    for a, b in zip(nodes, nodes):
-        a == a  # noqa: B015
-        a == b  # noqa: B015
-        b == a  # noqa: B015
-        if a != b:
-            expected += 1
-        assert Node.num_equal_calls == expected
-
-    assert len(cache) == expected
-
-    # check that cache is evicted once nodes get collected
-    del nodes
-    assert len(cache) == 0
-
-    a = Node(name="a")
-    b = Node(name="a")
-    assert a == b
+    copies = [Node(name=node.name) for node in nodes]
+
+    for a, b in zip(nodes, copies):
+        assert a == a
+        assert a == b
+        assert b == a
+    assert Node.num_equal_calls == len(nodes)
+
+    # every node is only equal to its own copy
+    for a in nodes:
+        for b in copies:
+            assert (a == b) is (a.name == b.name)
+    assert Node.num_equal_calls == len(nodes) ** 2
 
 
 class OneAndOnly(Singleton):
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from ibis.common.caching import CacheInfo, LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is the least recently used entry
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    assert cache.info() == CacheInfo(
+        hits=2, misses=1, evictions=1, maxsize=2, currsize=2
+    )
+
+    cache.maxsize = 1
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+    cache.clear()
+    assert cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=1, currsize=0
+    )
+
+
+def test_lru_cache_ttl(mocker):
+    now = mocker.patch("time.monotonic", return_value=0.0)
+
+    cache = LRUCache(2, ttl=10)
+    cache.put("a", 1)
+    now.return_value = 9.0
+    assert cache.get("a") == 1
+
+    now.return_value = 10.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+    cache.put("b", 2)
+    cache.invalidate()
+    assert cache.info() == CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=2, currsize=0
+    )
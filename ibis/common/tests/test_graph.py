@@ -170,6 +170,18 @@ def test_replace_with_mapping():
     assert result == new_A
 
 
+def test_replace_with_phases():
+    lower = InstanceOf(MyNode) >> _.copy(name=_.name.lower())
+    double = pattern(MyNode)(name="b") >> _.copy(name="bb")
+    subs = {D: MyNode(name="X", children=[])}
+
+    result = A.replace([subs, lower, double])
+    expected = A.replace(subs).replace(lower).replace(double)
+    assert result == expected
+    assert result.children[0].name == "bb"
+    assert result.children[0].children[0].name == "x"
+
+
 @pytest.mark.parametrize("kind", ["pattern", "mapping", "function"])
 def test_replace_doesnt_recreate_unchanged_nodes(kind):
     A1 = MyNode(name="A1", children=[])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import gc
 import pickle
 import sys
 import weakref
@@ -30,6 +31,7 @@ from ibis.common.grounds import (
     Concrete,
     Immutable,
     Singleton,
+    interning,
 )
 from ibis.common.patterns import (
     Any,
@@ -1011,7 +1013,7 @@ def test_concrete():
         object,
     )
 
-    assert BetweenWithCalculated.__create__.__func__ is Annotable.__create__.__func__
+    assert BetweenWithCalculated.__create__.__func__ is Concrete.__create__.__func__
     assert BetweenWithCalculated.__eq__ is Comparable.__eq__
     assert BetweenWithCalculated.__argnames__ == ("value", "lower", "upper")
 
@@ -1044,6 +1046,80 @@ def test_concrete():
     assert pickle.loads(pickle.dumps(obj)) == obj
 
 
+def test_concrete_interning():
+    obj = BetweenWithCalculated(10, lower=5, upper=15)
+
+    with interning(BetweenWithCalculated) as table:
+        a = BetweenWithCalculated(10, lower=5, upper=15)
+        b = BetweenWithCalculated(10, lower=5, upper=15)
+        c = BetweenWithCalculated(10, lower=5, upper=20)
+        assert a is b
+        assert a is not c
+        assert a is not obj
+        assert a == obj
+        assert a.copy(upper=20) is c
+        assert pickle.loads(pickle.dumps(a)) is a
+        assert len(table) == 2
+
+        # the instances are held weakly
+        del a, b
+        gc.collect()
+        assert len(table) == 1
+
+    assert "__interned__" not in BetweenWithCalculated.__dict__
+    assert BetweenWithCalculated(10, lower=5, upper=20) is not c
+
+
+def test_concrete_generated_constructors():
+    class Base(Concrete):
+        value = is_int
+        lower = optional(is_int, default=0)
+
+        @attribute
+        def calculated(self):
+            return self.value + self.lower
+
+    class Derived(Base):
+        upper = is_int
+
+    class Custom(Base):
+        upper = is_int
+
+        def __init__(self, value, lower, upper):
+            super().__init__(value=value, lower=lower, upper=max(upper, value))
+
+    a = Base(1, lower=None)
+    assert Base.__validators__ is not None
+    assert "__init__" in Base.__dict__
+    assert a.args == (1, 0)
+    assert a.calculated == 1
+    assert hash(a) == hash((Base, (1, 0)))
+    assert a.copy(value=2) == Base(2)
+
+    # subclasses get their own constructors, custom ones are kept
+    b = Derived(1, 2)
+    assert Derived.__init__ is not Base.__init__
+    assert b.args == (1, 2, 0)
+    init = Custom.__init__
+    c = Custom(5, 2)
+    assert Custom.__init__ is init
+    assert c.args == (5, 5, 0)
+    assert c.calculated == 5
+
+    # failures are reported by the generic validation
+    with pytest.raises(ValidationError, match="is not an int"):
+        Base("1")
+    with pytest.raises(ValidationError, match="missing a required argument"):
+        Derived(1)
+    with pytest.raises(TypeError, match="missing required argument"):
+        Derived.__recreate__({"value": 1})
+
+    # variadic arguments are bound like a regular call would
+    d = VariadicArgsAndKeywords(1, 2, a=3)
+    assert d.__args__ == ((1, 2), {"a": 3})
+    assert d.copy(args=(4,)) == VariadicArgsAndKeywords(4, a=3)
+
+
 def test_composition_of_concrete_and_singleton():
     class ConcSing(Concrete, Singleton):
         value = CoercedTo(int)
@@ -40,12 +40,37 @@ class SQL(Config):
         explicit limit. [](`None`) means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    compile_cache_size : int
+        Maximum number of compiled queries each SQL backend connection keeps
+        in its least-recently-used compilation cache. `0` disables the cache.
+        Cached entries keep their expressions alive, including any in-memory
+        tables they reference.
+    bind_params : bool
+        Whether to pass scalar parameter values to the database driver as
+        bound parameters instead of inlining them as literals, on backends
+        whose drivers support it. This lets the database reuse the query plan
+        across parameter values.
+    metadata_cache_size : int
+        Maximum number of `get_schema` and `list_tables` results each SQL
+        backend connection caches. `0` disables the cache. Cached entries are
+        invalidated by the connection methods that modify tables, such as
+        `create_table` or `drop_view`. Statements run with `raw_sql` do not
+        invalidate them, call `clear_metadata_cache` after using it to
+        modify tables.
+    metadata_cache_ttl : int | None
+        Number of seconds cached metadata stays valid, which bounds how stale
+        the cache can be with respect to changes made outside of the
+        connection. [](`None`) means entries never expire.
 
     """
 
     fuse_selects: bool = True
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    compile_cache_size: PosInt = 0
+    bind_params: bool = False
+    metadata_cache_size: PosInt = 0
+    metadata_cache_ttl: Optional[PosInt] = 60
 
 
 class Interactive(Config):
@@ -130,8 +155,16 @@ class Options(Config):
         set.
     sql: SQL
         SQL-related options.
+    dedup_memtables : bool
+        Whether `ibis.memtable` returns the existing in-memory table when
+        called with data identical to that of a live unnamed memtable. Backends
+        upload each in-memory table once, so deduplicating lets repeated
+        queries over the same data reuse the uploaded table. The data is
+        fingerprinted by hashing its Arrow representation.
     clickhouse : Config | None
         Clickhouse specific options.
+    datafusion : Config | None
+        DataFusion specific options.
     impala : Config | None
         Impala specific options.
     pandas : Config | None
@@ -148,7 +181,9 @@ class Options(Config):
     graphviz_repr: bool = False
     default_backend: Optional[Any] = None
     sql: SQL = SQL()
+    dedup_memtables: bool = False
     clickhouse: Optional[Config] = None
+    datafusion: Optional[Config] = None
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
     pyspark: Optional[Config] = None
@@ -8,6 +8,7 @@ import functools
 import itertools
 import numbers
 import operator
+import weakref
 from collections import Counter
 from typing import TYPE_CHECKING, Any, overload
 
@@ -20,12 +21,11 @@ from ibis import selectors, util
 from ibis.backends import BaseBackend, connect
 from ibis.common.deferred import Deferred, _, deferrable
 from ibis.common.dispatch import lazy_singledispatch
-from ibis.common.exceptions import IbisInputError
+from ibis.common.exceptions import IbisInputError, UnsupportedOperationError
 from ibis.common.grounds import Concrete
 from ibis.common.temporal import normalize_datetime, normalize_timezone
 from ibis.expr.decompile import decompile
 from ibis.expr.schema import Schema
-from ibis.expr.sql import parse_sql, to_sql
 from ibis.expr.types import (
     Column,
     DateValue,
@@ -101,7 +101,6 @@ __all__ = (
     "null",
     "or_",
     "param",
-    "parse_sql",
     "percent_rank",
     "pi",
     "preceding",
@@ -122,7 +121,6 @@ __all__ = (
     "table",
     "time",
     "timestamp",
-    "to_sql",
     "today",
     "trailing_range_window",
     "trailing_window",
@@ -133,6 +131,15 @@ __all__ = (
 )
 
 
+def __getattr__(name: str) -> Any:
+    # the SQL helpers are loaded on first access to avoid importing sqlglot
+    if name in ("parse_sql", "to_sql"):
+        import ibis.expr.sql
+
+        return globals().setdefault(name, getattr(ibis.expr.sql, name))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 dtype = dt.dtype
 infer_dtype = dt.infer
 infer_schema = sch.infer
@@ -412,12 +419,31 @@ def memtable(
             "pass one or the other but not both"
         )
 
-    if schema is not None:
-        import ibis
+    import ibis
 
+    if schema is not None:
         schema = ibis.schema(schema)
 
-    return _memtable(data, name=name, schema=schema, columns=columns)
+    expr = _memtable(data, name=name, schema=schema, columns=columns)
+    if name is None and ibis.options.dedup_memtables:
+        return _dedup_memtable(expr)
+    return expr
+
+
+# live unnamed memtables keyed by the fingerprint of their data
+_memtables_by_fingerprint: weakref.WeakValueDictionary[str, ops.InMemoryTable] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _dedup_memtable(expr: ir.Table) -> ir.Table:
+    op = expr.op()
+    try:
+        fingerprint = op.data.fingerprint(op.schema)
+    except UnsupportedOperationError:
+        # the data can't be fingerprinted without materializing it
+        return expr
+    return _memtables_by_fingerprint.setdefault(fingerprint, op).to_expr()
 
 
 @lazy_singledispatch
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import weakref
 from abc import abstractmethod
-from typing import Generic, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Generic, Optional
 
 from public import public
 from typing_extensions import Any, Self, TypeVar
@@ -10,15 +12,115 @@ import ibis.expr.datashape as ds
 import ibis.expr.datatypes as dt
 import ibis.expr.rules as rlz
 from ibis.common.annotations import attribute
+from ibis.common.graph import Graph
 from ibis.common.graph import Node as Traversable
 from ibis.common.grounds import Concrete
 from ibis.common.patterns import Coercible, CoercionError
 from ibis.common.typing import DefaultTypeVars
 from ibis.util import is_iterable
 
+if TYPE_CHECKING:
+    from ibis.backends import BaseBackend
+
+
+@public
+class Facts:
+    """Summary of the nodes reachable from a root node.
+
+    The nodes are collected in a single breadth-first traversal and every
+    lookup is answered from that traversal, so the hooks that run before an
+    expression is executed don't traverse the expression once per question.
+    Use `Node.__facts__` to get the memoized facts of a node.
+    """
+
+    def __init__(self, root: Node) -> None:
+        nodes = iter(Graph.from_bfs(root))
+        # the root is referenced weakly, because the root keeps a reference to
+        # its facts
+        self._root = weakref.ref(next(nodes))
+        self._rest = tuple(nodes)
+        self._found = {}
+
+    @property
+    def nodes(self) -> tuple[Node, ...]:
+        """All the nodes reachable from the root, in breadth-first order."""
+        return (self._root(), *self._rest)
+
+    def find(self, types: type | tuple[type, ...]) -> list[Node]:
+        """Return the nodes that are instances of `types`.
+
+        Equivalent to `Node.find(types)` without traversing the graph again.
+        """
+        try:
+            found = self._found[types]
+        except KeyError:
+            found = self._found[types] = [
+                node for node in self.nodes if isinstance(node, types)
+            ]
+        return list(found)
+
+    @cached_property
+    def memtables(self) -> tuple[Node, ...]:
+        """The in-memory tables of the expression."""
+        from ibis.expr.operations.relations import InMemoryTable
+
+        return tuple(self.find(InMemoryTable))
+
+    @cached_property
+    def physical_tables(self) -> tuple[Node, ...]:
+        """The physical tables of the expression."""
+        from ibis.expr.operations.relations import PhysicalTable
+
+        return tuple(self.find(PhysicalTable))
+
+    @cached_property
+    def udfs(self) -> tuple[Node, ...]:
+        """The scalar UDFs of the expression."""
+        from ibis.expr.operations.udf import ScalarUDF
+
+        return tuple(self.find(ScalarUDF))
+
+    @cached_property
+    def has_geospatial(self) -> bool:
+        """Whether the expression contains geospatial operations."""
+        from ibis.expr.operations.geospatial import GeoSpatialBinOp, GeoSpatialUnOp
+
+        return bool(self.find((GeoSpatialUnOp, GeoSpatialBinOp)))
+
+    @cached_property
+    def backends(self) -> tuple[tuple[BaseBackend, ...], bool]:
+        """The backends of the expression and whether it has unbound tables."""
+        from ibis.expr.operations.relations import (
+            DatabaseTable,
+            SQLQueryResult,
+            UnboundTable,
+        )
+
+        backends = set()
+        has_unbound = False
+        for table in self.find((UnboundTable, DatabaseTable, SQLQueryResult)):
+            if isinstance(table, UnboundTable):
+                has_unbound = True
+            else:
+                backends.add(table.source)
+
+        return tuple(backends), has_unbound
+
 
 @public
 class Node(Concrete, Traversable):
+    __slots__ = ("__cached_facts__",)
+
+    @property
+    def __facts__(self) -> Facts:
+        """The memoized `Facts` about the nodes reachable from this node."""
+        try:
+            return self.__cached_facts__
+        except AttributeError:
+            facts = Facts(self)
+            object.__setattr__(self, "__cached_facts__", facts)
+            return facts
+
     def equals(self, other) -> bool:
         if not isinstance(other, Node):
             raise TypeError(
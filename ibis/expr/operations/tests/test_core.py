@@ -231,3 +231,20 @@ def test_expression_class_aliases():
     assert ir.AnyValue is ir.Value
     assert ir.AnyScalar is ir.Scalar
     assert ir.AnyColumn is ir.Column
+
+
+def test_node_facts():
+    mt = ibis.memtable({"a": [1, 2]}, name="mt")
+    expr = t.join(mt, "a").mutate(b=ibis.random())
+    node = expr.op()
+
+    facts = node.__facts__
+    assert node.__facts__ is facts
+
+    assert facts.nodes == tuple(node.find(ops.Node))
+    assert facts.find(ops.Field) == node.find(ops.Field)
+    assert facts.memtables == (mt.op(),)
+    assert set(facts.physical_tables) == {t.op(), mt.op()}
+    assert facts.udfs == ()
+    assert not facts.has_geospatial
+    assert facts.backends == ((), True)
@@ -152,6 +152,19 @@ def test_memtable_column_names_match_schema():
     assert t.op().data.to_frame().columns.tolist() == ["a", "b"]
 
 
+def test_memtable_dedup(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(ibis.options, "dedup_memtables", True)
+
+    t = ibis.memtable({"a": [1, 2, 3]})
+    assert ibis.memtable(pa.table({"a": [1, 2, 3]})).op() is t.op()
+    assert ibis.memtable(pa.table({"a": [0, 1, 2, 3]}).slice(1)).op() is t.op()
+
+    assert ibis.memtable({"a": [1, 2, 4]}).op() is not t.op()
+    assert ibis.memtable({"a": [1, 2, 3]}, schema={"a": "int8"}).op() is not t.op()
+    assert ibis.memtable({"a": [1, 2, 3]}, name="t").op() is not t.op()
+
+
 @pytest.mark.parametrize(
     "op",
     [
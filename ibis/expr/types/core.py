@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import contextlib
 import os
-import webbrowser
 from typing import TYPE_CHECKING, Any, NoReturn
 
 from public import public
@@ -244,6 +243,8 @@ class Expr(Immutable, Coercible):
         ImportError
             If `graphviz` is not installed.
         """
+        import webbrowser
+
         import ibis.expr.visualize as viz
 
         path = viz.draw(
@@ -326,15 +327,7 @@ class Expr(Immutable, Coercible):
             A list of the backends found.
         """
 
-        backends = set()
-        has_unbound = False
-        node_types = (ops.UnboundTable, ops.DatabaseTable, ops.SQLQueryResult)
-        for table in self.op().find(node_types):
-            if isinstance(table, ops.UnboundTable):
-                has_unbound = True
-            else:
-                backends.add(table.source)
-
+        backends, has_unbound = self.op().__facts__.backends
         return list(backends), has_unbound
 
     def _find_backend(self, *, use_default: bool = False) -> BaseBackend:
@@ -251,6 +251,19 @@ class TableProxy(PseudoHashable[T]):
     def to_polars(self, schema: Schema) -> pl.DataFrame:  # pragma: no cover
         """Convert this input to a Polars DataFrame."""
 
+    def fingerprint(self, schema: Schema) -> str:
+        """Return a digest of the contents of this input converted to `schema`.
+
+        Inputs with the same fingerprint hold the same data.
+        """
+        import hashlib
+
+        data = self.to_pyarrow(schema=schema)
+        digest = hashlib.sha256(data.schema.remove_metadata().serialize())
+        for batch in data.to_batches():
+            digest.update(batch.serialize())
+        return digest.hexdigest()
+
     def to_pyarrow_bytes(self, schema: Schema) -> bytes:
         import pyarrow as pa
         import pyarrow_hotfix  # noqa: F401
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 import pyarrow as pa
@@ -13,12 +14,14 @@ from ibis.formats import DataMapper, SchemaMapper, TableProxy, TypeMapper
 from ibis.util import V
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
     import pandas as pd
     import polars as pl
     import pyarrow.dataset as ds
 
+    from ibis.formats.pandas import PandasData
+
 
 _from_pyarrow_types = {
     pa.int8(): dt.Int8,
@@ -335,6 +338,82 @@ class PyArrowData(DataMapper):
         return pa.Table.from_arrays(arrays, names=list(schema.keys()))
 
 
+def _build_array(values: Sequence, typ: pa.DataType) -> pa.Array:
+    return pa.array(values, type=typ)
+
+
+def _build_array_cast(values: Sequence, typ: pa.DataType) -> pa.Array:
+    # drivers return e.g. integers for booleans or floats for decimals, which
+    # arrow refuses to build directly into the target type
+    try:
+        return pa.array(values, type=typ)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(values).cast(typ)
+
+
+class PyArrowRowDecoder:
+    """Decode batches of DB-API result rows into Arrow record batches.
+
+    The rows are transposed into columns once per batch, and each column is
+    built by a typed builder resolved from the schema up front, without
+    allocating a tuple or struct value for every row.
+
+    Parameters
+    ----------
+    schema
+        Ibis schema of the rows to decode.
+    """
+
+    __slots__ = ("_builders", "arrow_schema")
+
+    def __init__(self, schema: Schema) -> None:
+        self.arrow_schema = PyArrowSchema.from_ibis(schema)
+        self._builders = [
+            (self._builder(dtype), field.type)
+            for dtype, field in zip(schema.types, self.arrow_schema)
+        ]
+
+    def _builder(self, dtype: dt.DataType) -> Callable[[list, pa.DataType], pa.Array]:
+        """Return the function building an array of `dtype` from a column."""
+        if dtype.is_boolean() or dtype.is_decimal():
+            return _build_array_cast
+        return _build_array
+
+    @staticmethod
+    def _pandas_builder(
+        converter: type[PandasData], dtype: dt.DataType
+    ) -> Callable[[list, pa.DataType], pa.Array]:
+        """Build arrays of `dtype` by parsing the values with `converter`.
+
+        For columns whose driver values arrow can't build directly, e.g.
+        temporal values returned as text.
+        """
+
+        def build(values: list, typ: pa.DataType) -> pa.Array:
+            import pandas as pd
+
+            s = converter.convert_column(pd.Series(values, dtype=object), dtype)
+            if pa.types.is_time(typ) and s.dtype.kind == "m":
+                # pandas represents times as durations since midnight
+                nanos = pa.Array.from_pandas(s.astype("timedelta64[ns]"))
+                return nanos.cast(pa.int64()).cast(pa.time64("ns")).cast(typ)
+            return pa.Array.from_pandas(s, type=typ)
+
+        return build
+
+    def decode(self, rows: Iterable[Sequence]) -> pa.RecordBatch:
+        """Transpose `rows` into a record batch."""
+        if not isinstance(rows, list):
+            rows = list(rows)
+        # gathering one column at a time avoids the per-row iterators that
+        # `zip(*rows)` allocates, which get expensive for large batches
+        arrays = [
+            build(list(map(itemgetter(i), rows)), typ)
+            for i, (build, typ) in enumerate(self._builders)
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.arrow_schema)
+
+
 class PyArrowTableProxy(TableProxy[V]):
     def to_frame(self):
         return self.obj.to_pandas()
@@ -284,3 +284,28 @@ def test_schema___arrow_c_schema__():
     schema = ibis.schema({"a": dt.int64, "b": dt.string, "c": dt.boolean})
     pa_schema = pa.schema(schema)
     assert pa_schema == schema.to_pyarrow()
+
+
+def test_row_decoder():
+    schema = ibis.schema(
+        {"a": dt.int64, "b": dt.string, "c": dt.boolean, "d": dt.Decimal(10, 2)}
+    )
+    decoder = ipa.PyArrowRowDecoder(schema)
+    assert decoder.arrow_schema == schema.to_pyarrow()
+
+    # integer booleans and float decimals are cast to the target type
+    batch = decoder.decode([(1, "x", 1, 1.5), (None, None, 0, None)])
+    expected = pa.record_batch(
+        [
+            pa.array([1, None], type=pa.int64()),
+            pa.array(["x", None]),
+            pa.array([True, False]),
+            pa.array([1.5, None]).cast(pa.decimal128(10, 2)),
+        ],
+        schema=decoder.arrow_schema,
+    )
+    assert batch.equals(expected)
+
+    empty = decoder.decode([])
+    assert empty.num_rows == 0
+    assert empty.schema == decoder.arrow_schema
@@ -11,6 +11,9 @@ import operator
 import os
 import random
 import string
+import subprocess
+import sys
+import tracemalloc
 
 import pytest
 import pytz
@@ -145,6 +148,21 @@ def test_construction(benchmark, construction_fn, t, base):
     benchmark(construction_fn, t, base)
 
 
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize(
+    "module", ["ibis", "ibis.backends.sql.compilers.duckdb"], ids=["ibis", "compiler"]
+)
+def test_import_time(benchmark, module):
+    # a fresh interpreter is required since modules are cached after the
+    # first import
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", f"import {module}"],),
+        kwargs=dict(check=True),
+        rounds=10,
+    )
+
+
 @pytest.mark.benchmark(group="builtins")
 @pytest.mark.parametrize(
     "expr_fn",
@@ -492,6 +510,25 @@ def test_large_expr_equals(benchmark, tpc_h02):
     benchmark(ir.Expr.equals, tpc_h02, copy.deepcopy(tpc_h02))
 
 
+@pytest.mark.benchmark(group="equality")
+def test_large_expr_equals_fresh(benchmark):
+    def build_and_compare():
+        # structurally equal, but distinct objects at every level
+        left = make_big_union(make_base(make_t()), 20)
+        right = make_big_union(make_base(make_t()), 20)
+        return left.equals(right)
+
+    assert benchmark(build_and_compare)
+
+    tracemalloc.start()
+    try:
+        build_and_compare()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_bytes"] = peak
+
+
 @pytest.mark.benchmark(group="datatype")
 @pytest.mark.parametrize(
     "dtypes",
@@ -813,6 +850,42 @@ def test_big_join_compile(benchmark, src, diff):
     assert len(t)
 
 
+@pytest.mark.benchmark(group="compilation")
+def test_compile_tpc_h02(benchmark, tpc_h02):
+    pytest.importorskip("duckdb")
+
+    sql = benchmark(ibis.to_sql, tpc_h02, dialect="duckdb")
+    assert sql
+
+
+@pytest.fixture
+def join_chain(request):
+    expr = ibis.table({"k": "int64", "v": "float64"}, name="base")
+    for i in range(request.param):
+        t = ibis.table({"k": "int64", f"x{i}": "float64"}, name=f"t{i}")
+        t = t.filter(t[f"x{i}"] > i).mutate(**{f"y{i}": t[f"x{i}"] * 2})
+        expr = (
+            expr.left_join(t, "k")
+            .drop("k_right")
+            .mutate(**{f"z{i}": ibis._[f"y{i}"] + 1})
+            .filter(ibis._.v > 0)
+        )
+    return expr
+
+
+@pytest.mark.benchmark(group="compilation")
+@pytest.mark.parametrize("join_chain", [10, 30], indirect=True)
+def test_join_chain_compile(benchmark, join_chain):
+    pytest.importorskip("duckdb")
+
+    from ibis.backends.sql.compilers import DuckDBCompiler
+
+    # compile to sqlglot only, rendering very deep queries hits the recursion
+    # limit of the sqlglot generator
+    compiler = DuckDBCompiler()
+    assert benchmark(compiler.to_sqlglot, join_chain) is not None
+
+
 @pytest.mark.timeout(5)
 def test_big_expression_compile(benchmark):
     pytest.importorskip("duckdb")
@@ -1019,3 +1092,88 @@ def test_dedup_schema(benchmark):
             itertools.cycle(("int", "string", "array<int>", "float")),
         ),
     )
+
+
+@pytest.fixture(scope="module")
+def cursor_rows():
+    pytest.importorskip("pyarrow")
+    schema = sch.Schema(
+        {
+            "id": dt.int64,
+            "value": dt.float64,
+            "name": dt.string,
+            "flag": dt.boolean,
+            "ts": dt.timestamp,
+        }
+    )
+    start = datetime.datetime(2020, 1, 1)
+    rows = [
+        (
+            i,
+            i * 1.5,
+            f"name{i}",
+            i % 2 == 0,
+            start + datetime.timedelta(seconds=i),
+        )
+        for i in range(100_000)
+    ]
+    return schema, rows
+
+
+def decode_struct(schema, rows):
+    import pyarrow as pa
+
+    array = pa.array(map(tuple, rows), type=schema.as_struct().to_pyarrow())
+    return pa.RecordBatch.from_struct_array(array)
+
+
+def decode_columnar(schema, rows):
+    from ibis.formats.pyarrow import PyArrowRowDecoder
+
+    return PyArrowRowDecoder(schema).decode(rows)
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize("decode", [decode_struct, decode_columnar])
+def test_cursor_rows_to_pyarrow(benchmark, cursor_rows, decode):
+    schema, rows = cursor_rows
+    batch = benchmark(decode, schema, rows)
+    assert batch.num_rows == len(rows)
+    if benchmark.enabled:
+        benchmark.extra_info["rows_per_sec"] = len(rows) / benchmark.stats["mean"]
+
+
+@pytest.fixture(scope="module")
+def duckdb_results():
+    pytest.importorskip("duckdb")
+
+    con = ibis.duckdb.connect()
+    con.raw_sql(
+        """
+        CREATE TABLE results AS
+        SELECT
+            CASE WHEN i % 2 = 0 THEN NULL ELSE i END AS int_col,
+            CASE WHEN i % 2 = 0 THEN NULL ELSE CAST(i AS DOUBLE) * 1.5 END AS float_col,
+            CASE WHEN i % 2 = 0 THEN NULL ELSE i % 3 = 0 END AS bool_col,
+            CASE WHEN i = 0 THEN NULL ELSE CAST(i AS DOUBLE) * 2.5 END AS one_null_col,
+            CASE WHEN i % 2 = 0 THEN NULL ELSE [i, i + 1] END AS array_col,
+            {'a': i, 'b': CAST(i AS VARCHAR)} AS struct_col
+        FROM range(1_000_000) _ (i)
+        """
+    )
+    return con.table("results")
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize(
+    "columns",
+    [
+        pytest.param(["int_col", "float_col", "bool_col"], id="null_heavy"),
+        pytest.param(["one_null_col"], id="one_null"),
+        pytest.param(["array_col", "struct_col"], id="nested"),
+    ],
+)
+def test_duckdb_execute_nulls(benchmark, duckdb_results, columns):
+    expr = duckdb_results.select(*columns)
+    df = benchmark(expr.execute)
+    assert len(df) == 1_000_000
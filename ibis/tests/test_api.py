@@ -61,7 +61,9 @@ def test_multiple_backends(mocker):
         ibis.foo  # noqa: B018
 
 
-@pytest.mark.parametrize("module", ["pandas", "pyarrow"])
+@pytest.mark.parametrize(
+    "module", ["pandas", "pyarrow", "sqlglot", "ibis.backends.sql.compilers.base"]
+)
 def test_no_import(module):
     script = f"""
 import ibis